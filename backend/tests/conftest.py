@@ -1,15 +1,37 @@
 """
 Pytest configuration and fixtures for SAP ERP Demo tests.
 """
+import os
 import pytest
 import asyncio
 from typing import AsyncGenerator
+from hypothesis import settings, HealthCheck
+from hypothesis.database import DirectoryBasedExampleDatabase
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 from backend.db.database import Base
 
 
+# Hypothesis profiles. Every property test pins its own max_examples with
+# @settings, so the profiles only govern timing checks: "ci" also suppresses
+# the too_slow health check for noisy shared runners, "dev" keeps it so slow
+# strategies show up locally. Select with HYPOTHESIS_PROFILE=ci|dev. Both share
+# one example database under backend/.hypothesis/examples so CI can cache it
+# and replay earlier failures in the reuse phase before generating new examples.
+_EXAMPLE_DATABASE = DirectoryBasedExampleDatabase(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".hypothesis", "examples")
+)
+settings.register_profile(
+    "ci",
+    database=_EXAMPLE_DATABASE,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("dev", database=_EXAMPLE_DATABASE, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -24,10 +46,13 @@ async def db() -> AsyncGenerator[AsyncSession, None]:
     Create a test database session.
     Uses an in-memory SQLite database for testing.
     """
-    # Create in-memory SQLite database for testing
+    # Create in-memory SQLite database for testing. StaticPool keeps a single
+    # connection, so the schema created below and every session share the same
+    # in-memory database and commits never touch disk
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
-        poolclass=NullPool,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
         echo=False
     )
     
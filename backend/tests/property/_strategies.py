@@ -0,0 +1,23 @@
+"""
+Shared Hypothesis strategies for the property-based test modules.
+Built once at import so every @given binds the same strategy objects.
+"""
+from datetime import date
+
+from hypothesis import strategies as st
+
+from backend.models.pm_models import AssetType, OrderType
+from backend.services.observability import LogLevel
+
+
+LOG_LEVEL = st.sampled_from(tuple(LogLevel))
+ASSET_TYPE = st.sampled_from(tuple(AssetType))
+ORDER_TYPE = st.sampled_from(tuple(OrderType))
+
+DATES = st.dates(
+    min_value=date(2000, 1, 1),
+    max_value=date(2030, 12, 31)
+)
+
+# 1-50 chars of A-Z/0-9/-, not starting or ending with '-'
+ASSET_ID = st.from_regex(r"[A-Z0-9](?:[A-Z0-9-]{0,48}[A-Z0-9])?", fullmatch=True)
@@ -0,0 +1,16 @@
+"""
+Pytest configuration for the property-based test suite.
+"""
+from pathlib import Path
+
+import pytest
+
+
+_PROPERTY_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every test under tests/property so pytest -m property selects the whole suite"""
+    for item in items:
+        if _PROPERTY_DIR in item.path.parents:
+            item.add_marker(pytest.mark.property)
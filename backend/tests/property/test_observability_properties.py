@@ -3,52 +3,78 @@ Property-based tests for observability features.
 **Feature: sap-erp-demo, Property 13: Structured Log Format**
 **Validates: Requirements 6.2**
 """
+import contextvars
 import json
+import re
+
+import pytest
 from hypothesis import given, strategies as st, settings
 
 from backend.services.observability import (
     StructuredLogger, LogLevel, validate_log_entry,
-    get_correlation_id, set_correlation_id,
+    get_correlation_id, set_correlation_id, correlation_id_var,
 )
+from backend.tests.property._strategies import LOG_LEVEL
 
 
 # Strategies for generating test data
-log_level_strategy = st.sampled_from(list(LogLevel))
+log_level_strategy = LOG_LEVEL
 message_strategy = st.text(min_size=1, max_size=500).filter(lambda x: x.strip())
 service_name_strategy = st.text(min_size=1, max_size=50).filter(lambda x: x.strip() and x.isalnum())
 
+_LOGGER = StructuredLogger(service_name="test-service")
 
-@settings(max_examples=100)
+# One correlation id bound for the module's tests so _create_log_entry reads it
+# from the context instead of generating a uuid4 per entry
+_CORRELATION_ID = "00000000-0000-4000-8000-000000000000"
+_REQUIRED_FIELDS = frozenset({"correlation_id", "timestamp", "service", "log_level", "message"})
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_ISO_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{6})?Z")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _bound_correlation_id():
+    """Bind _CORRELATION_ID for this module only and restore the previous value after"""
+    token = correlation_id_var.set(_CORRELATION_ID)
+    yield
+    correlation_id_var.reset(token)
+
+
+@settings(max_examples=20)
 @given(
-    level=log_level_strategy,
-    message=message_strategy
+    batch=st.lists(
+        st.tuples(log_level_strategy, message_strategy),
+        min_size=20,
+        max_size=20
+    )
 )
-def test_log_entry_has_required_fields(level: LogLevel, message: str):
+def test_log_entry_properties(batch):
     """
     **Feature: sap-erp-demo, Property 13: Structured Log Format**
-    **Validates: Requirements 6.2**
+    **Validates: Requirements 6.2, 6.3**
     
     Property: For any API request processed by the system, the generated log entry SHALL:
     - Be valid JSON
-    - Contain correlation_id, timestamp, service, and log_level fields
+    - Contain correlation_id, timestamp, service, log_level and message fields
+    - Pass validate_log_entry
+    - Carry a UUID correlation_id and an ISO 8601 UTC timestamp
     """
-    logger = StructuredLogger(service_name="test-service")
-    entry = logger._create_log_entry(level, message)
-    
-    # Verify it's valid JSON
-    json_str = json.dumps(entry)
-    parsed = json.loads(json_str)
-    
-    # Verify required fields
-    assert "correlation_id" in parsed, "correlation_id missing"
-    assert "timestamp" in parsed, "timestamp missing"
-    assert "service" in parsed, "service missing"
-    assert "log_level" in parsed, "log_level missing"
-    assert "message" in parsed, "message missing"
+    entries = [_LOGGER._create_log_entry(level, message) for level, message in batch]
+    
+    # Verify the whole batch is valid JSON in a single encode/decode, with the
+    # same stdlib encoder the logger uses
+    parsed = json.loads(json.dumps(entries))
+    
+    for entry in parsed:
+        assert _REQUIRED_FIELDS <= entry.keys(), f"missing {_REQUIRED_FIELDS - entry.keys()}"
+        assert validate_log_entry(entry), "Valid log entry should pass validation"
+        assert _UUID_RE.fullmatch(entry["correlation_id"]), \
+            f"correlation_id '{entry['correlation_id']}' is not a valid UUID"
+        assert _ISO_TS_RE.fullmatch(entry["timestamp"]), \
+            f"Timestamp '{entry['timestamp']}' is not valid ISO 8601"
 
 
-@settings(max_examples=100)
-@given(level=log_level_strategy)
+@pytest.mark.parametrize("level", list(LogLevel))
 def test_log_level_is_valid(level: LogLevel):
     """
     **Feature: sap-erp-demo, Property 13: Structured Log Format**
@@ -60,24 +86,6 @@ def test_log_level_is_valid(level: LogLevel):
     assert level.value in valid_levels, f"Invalid log level: {level.value}"
 
 
-@settings(max_examples=100)
-@given(
-    level=log_level_strategy,
-    message=message_strategy
-)
-def test_log_entry_validation(level: LogLevel, message: str):
-    """
-    **Feature: sap-erp-demo, Property 13: Structured Log Format**
-    **Validates: Requirements 6.2**
-    
-    Property: For any valid log entry, validate_log_entry SHALL return True.
-    """
-    logger = StructuredLogger(service_name="test-service")
-    entry = logger._create_log_entry(level, message)
-    
-    assert validate_log_entry(entry), "Valid log entry should pass validation"
-
-
 @settings(max_examples=100)
 @given(
     level=log_level_strategy,
@@ -93,12 +101,10 @@ def test_log_entry_with_extra_fields(level: LogLevel, message: str, extra_key: s
     Property: For any log entry with extra fields, the entry SHALL still be valid JSON
     and contain all required fields.
     """
-    logger = StructuredLogger(service_name="test-service")
-    entry = logger._create_log_entry(level, message, {extra_key: extra_value})
+    entry = _LOGGER._create_log_entry(level, message, {extra_key: extra_value})
     
     # Verify it's valid JSON
-    json_str = json.dumps(entry)
-    parsed = json.loads(json_str)
+    parsed = json.loads(json.dumps(entry))
     
     # Verify required fields still present
     assert validate_log_entry(parsed), "Log entry with extra fields should be valid"
@@ -109,55 +115,19 @@ def test_log_entry_with_extra_fields(level: LogLevel, message: str, extra_key: s
         assert extra_key in parsed["extra"], f"extra.{extra_key} should be present"
 
 
-@settings(max_examples=100)
-@given(
-    level=log_level_strategy,
-    message=message_strategy
-)
-def test_log_entry_timestamp_format(level: LogLevel, message: str):
-    """
-    **Feature: sap-erp-demo, Property 13: Structured Log Format**
-    **Validates: Requirements 6.2**
-    
-    Property: For any log entry, timestamp SHALL be in ISO 8601 format.
-    """
-    logger = StructuredLogger(service_name="test-service")
-    entry = logger._create_log_entry(level, message)
-    
-    timestamp = entry["timestamp"]
-    
-    # Should end with Z (UTC)
-    assert timestamp.endswith("Z"), "Timestamp should end with Z"
-    
-    # Should be parseable as ISO format
-    from datetime import datetime
-    try:
-        datetime.fromisoformat(timestamp.rstrip("Z"))
-    except ValueError:
-        assert False, f"Timestamp '{timestamp}' is not valid ISO 8601"
-
-
-@settings(max_examples=100)
-@given(
-    level=log_level_strategy,
-    message=message_strategy
-)
-def test_log_entry_correlation_id_is_uuid(level: LogLevel, message: str):
+def test_log_entry_generates_correlation_id_when_unset():
     """
     **Feature: sap-erp-demo, Property 13: Structured Log Format**
-    **Validates: Requirements 6.2, 6.3**
+    **Validates: Requirements 6.3**
     
-    Property: For any log entry, correlation_id SHALL be a valid UUID.
+    Property: When no correlation_id is bound, the log entry SHALL carry a
+    freshly generated UUID.
     """
-    import uuid
-    
-    logger = StructuredLogger(service_name="test-service")
-    entry = logger._create_log_entry(level, message)
+    def create_unbound_entry():
+        set_correlation_id("")
+        return _LOGGER._create_log_entry(LogLevel.INFO, "message")
     
-    correlation_id = entry["correlation_id"]
+    entry = contextvars.copy_context().run(create_unbound_entry)
     
-    # Should be a valid UUID
-    try:
-        uuid.UUID(correlation_id)
-    except ValueError:
-        assert False, f"correlation_id '{correlation_id}' is not a valid UUID"
+    assert _UUID_RE.fullmatch(entry["correlation_id"]), "correlation_id should be a UUID"
+    assert entry["correlation_id"] != _CORRELATION_ID, "correlation_id should not reuse the bound id"
@@ -3,7 +3,10 @@ Property-based tests for Plant Maintenance (PM) module.
 **Feature: sap-erp-demo, Property 3: Asset Data Round-Trip**
 **Validates: Requirements 2.1**
 """
+import itertools
 from datetime import date, datetime
+
+import pytest
 from hypothesis import given, strategies as st, settings
 
 from backend.models.pm_models import (
@@ -11,28 +14,26 @@ from backend.models.pm_models import (
     MaintenanceOrder, OrderType, OrderStatus,
     PMIncident, FaultType
 )
+from backend.tests.property._strategies import ASSET_ID, ASSET_TYPE, DATES, ORDER_TYPE
 
 
 # Strategies for generating test data
-asset_type_strategy = st.sampled_from(list(AssetType))
+asset_type_strategy = ASSET_TYPE
 asset_status_strategy = st.sampled_from(list(AssetStatus))
-order_type_strategy = st.sampled_from(list(OrderType))
+order_type_strategy = ORDER_TYPE
 fault_type_strategy = st.sampled_from(list(FaultType))
 
-asset_id_strategy = st.text(
-    alphabet=st.sampled_from("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"),
-    min_size=1,
-    max_size=50
-).filter(lambda x: x.strip() and not x.startswith('-') and not x.endswith('-'))
+asset_id_strategy = ASSET_ID
 
 name_strategy = st.text(min_size=1, max_size=255).filter(lambda x: x.strip())
 location_strategy = st.text(min_size=1, max_size=255).filter(lambda x: x.strip())
 description_strategy = st.text(min_size=0, max_size=1000)
 
-date_strategy = st.dates(
-    min_value=date(2000, 1, 1),
-    max_value=date(2030, 12, 31)
-)
+date_strategy = DATES
+
+# Synthetic IDs only need to be non-empty; a counter avoids hashing drawn strings
+_ASSET_ID_COUNTER = itertools.count()
+_ORDER_ID_COUNTER = itertools.count()
 
 
 @settings(max_examples=100)
@@ -110,7 +111,7 @@ def test_asset_required_fields(
     installation_date, status) SHALL be present and valid.
     """
     asset = Asset(
-        asset_id=f"AST-{hash(name) % 10000:04d}",
+        asset_id=f"AST-{next(_ASSET_ID_COUNTER):04d}",
         asset_type=asset_type,
         name=name,
         location=location,
@@ -127,8 +128,7 @@ def test_asset_required_fields(
     assert asset.status in AssetStatus, "status should be valid enum"
 
 
-@settings(max_examples=100)
-@given(asset_type=asset_type_strategy)
+@pytest.mark.parametrize("asset_type", list(AssetType))
 def test_asset_type_validity(asset_type: AssetType):
     """
     **Feature: sap-erp-demo, Property 3: Asset Data Round-Trip**
@@ -181,15 +181,10 @@ def test_asset_dict_roundtrip_consistency(
 
 # Additional tests for Property 4: Maintenance Order Asset Linkage
 
-from backend.models.pm_models import OrderType, OrderStatus
-
-
-order_type_strategy = st.sampled_from(list(OrderType))
 order_status_strategy = st.sampled_from(list(OrderStatus))
 
 
-@settings(max_examples=100)
-@given(order_type=order_type_strategy)
+@pytest.mark.parametrize("order_type", list(OrderType))
 def test_order_type_validity(order_type: OrderType):
     """
     **Feature: sap-erp-demo, Property 4: Maintenance Order Asset Linkage**
@@ -226,7 +221,7 @@ def test_maintenance_order_requires_valid_asset(
     
     # Create a maintenance order instance (without DB)
     order = MaintenanceOrder(
-        order_id=f"MO-{hash(asset_id) % 10000:04d}",
+        order_id=f"MO-{next(_ORDER_ID_COUNTER):04d}",
         asset_id=asset_id,
         order_type=order_type,
         status=OrderStatus.PLANNED,
@@ -244,25 +239,14 @@ def test_maintenance_order_requires_valid_asset(
     assert order.order_type in OrderType, "order_type should be valid enum"
 
 
-@settings(max_examples=100)
-@given(
-    asset_type=asset_type_strategy,
-    order_type=order_type_strategy
-)
-def test_maintenance_order_asset_type_compatibility(
-    asset_type: AssetType,
-    order_type: OrderType
-):
+def test_enum_value_sets():
     """
     **Feature: sap-erp-demo, Property 4: Maintenance Order Asset Linkage**
     **Validates: Requirements 2.2, 2.3**
     
-    Property: For any combination of asset_type and order_type, the system
-    SHALL accept the maintenance order (all asset types support all order types).
+    Property: The asset types (substation, transformer, feeder) and order types
+    (preventive, corrective, emergency) SHALL be exactly the supported sets, so
+    every asset type accepts every order type.
     """
-    # All asset types (substation, transformer, feeder) support all order types
-    valid_asset_types = {"substation", "transformer", "feeder"}
-    valid_order_types = {"preventive", "corrective", "emergency"}
-    
-    assert asset_type.value in valid_asset_types, f"Invalid asset type: {asset_type.value}"
-    assert order_type.value in valid_order_types, f"Invalid order type: {order_type.value}"
+    assert {t.value for t in AssetType} == {"substation", "transformer", "feeder"}
+    assert {t.value for t in OrderType} == {"preventive", "corrective", "emergency"}
@@ -5,15 +5,99 @@ Feature: pm-6-screen-workflow, Property 10: Audit Trail Immutability
 Validates: Requirements 9.1, 9.2, 9.3
 """
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from collections import Counter
+from itertools import pairwise
+from operator import attrgetter
+from typing import NamedTuple, Optional
+from hypothesis import given, strategies as st, settings, assume, HealthCheck, Phase
 from datetime import datetime, timedelta
 from backend.models.pm_workflow_models import (
     WorkflowOrderStatus, DocumentType, WorkflowOrderType
 )
 
 
+# Generation dominates these tests and failing flows are already small, so skip
+# the shrink/explain phases to bound wall-clock time on a regression
+FAST = settings(
+    max_examples=100,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.target),
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+
+# Tests that only exercise entries they build themselves find nothing new after
+# a handful of examples; derandomize them so they are reproducible without the
+# example database
+TRIVIAL = settings(FAST, max_examples=10, phases=(Phase.generate,), derandomize=True)
+
+
+# ASCII alphabets avoid Unicode category lookups on every drawn character
+_ALPHANUMERIC = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+ID_TEXT = st.text(alphabet=_ALPHANUMERIC + "-", min_size=10, max_size=30)
+USER_TEXT = st.text(alphabet=_ALPHANUMERIC, min_size=5, max_size=20)
+STATUS_TEXT = st.text(alphabet=_ALPHANUMERIC + " ", min_size=3, max_size=50)
+RELATED_DOC_TEXT = st.one_of(st.none(), ID_TEXT)
+
+
+# Mandatory document types for a TECO order: creation/release, GI, confirmation, TECO
+_MANDATORY_TYPES = frozenset({
+    DocumentType.ORDER,
+    DocumentType.GI,
+    DocumentType.CONFIRMATION,
+    DocumentType.TECO
+})
+
+
+def _assert_sorted(timestamps):
+    """Assert timestamps are in chronological order in a single short-circuiting pass"""
+    assert all(a <= b for a, b in pairwise(timestamps)), \
+        "Document flow entries should be in chronological order"
+
+
+class FlowEntry(NamedTuple):
+    """One document flow row as produced by the strategies below"""
+    flow_id: str
+    order_number: str
+    document_type: DocumentType
+    document_number: str
+    transaction_date: datetime
+    user_id: str
+    status: str
+    related_document: Optional[str] = None
+
+
+# Fields every document flow entry must populate
+_REQUIRED_FIELDS = ("flow_id", "document_type", "document_number", "transaction_date", "user_id", "status")
+_REQUIRED_VALUES = attrgetter(*_REQUIRED_FIELDS)
+
+# Reference time for generated and posted entries
+_NOW = datetime.utcnow()
+
+
+def _make_entry(i, order_number, doc_type):
+    """Build a posted document flow entry"""
+    return FlowEntry(
+        flow_id=f"FLOW-{i:012d}",
+        order_number=order_number,
+        document_type=doc_type,
+        document_number=f"DOC-{i:06d}",
+        transaction_date=_NOW,
+        user_id=f"USER{i:03d}",
+        status="posted",
+        related_document=None
+    )
+
+
+# Transaction dates within the last 24 hours
+_TRANSACTION_DATE = st.datetimes(min_value=_NOW - timedelta(days=1), max_value=_NOW)
+
+
 # Strategy for generating document types
-document_type_strategy = st.sampled_from(list(DocumentType))
+document_type_strategy = st.sampled_from(DocumentType)
+order_type_strategy = st.sampled_from(WorkflowOrderType)
+
+_FLOW_SEQ = st.integers(min_value=0, max_value=10**12 - 1)
+_OPTIONAL_COUNT = st.integers(min_value=0, max_value=3)
 
 
 # Strategy for generating document flow entries
@@ -21,151 +105,174 @@ document_type_strategy = st.sampled_from(list(DocumentType))
 def document_flow_entry_strategy(draw, order_number=None):
     """Generate random document flow entry"""
     if order_number is None:
-        order_number = draw(st.text(min_size=10, max_size=30, 
-                                   alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))))
+        order_number = draw(ID_TEXT)
     
     doc_type = draw(document_type_strategy)
-    doc_number = draw(st.text(min_size=10, max_size=30,
-                             alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))))
-    user_id = draw(st.text(min_size=5, max_size=20,
-                          alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))))
-    status = draw(st.text(min_size=3, max_size=50,
-                         alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs'))))
-    
-    # Generate timestamp
-    base_time = datetime.utcnow()
-    time_offset = draw(st.integers(min_value=0, max_value=86400))  # Within 24 hours
-    transaction_date = base_time - timedelta(seconds=time_offset)
+    doc_number = draw(ID_TEXT)
+    user_id = draw(USER_TEXT)
+    status = draw(STATUS_TEXT)
     
-    related_doc = draw(st.one_of(
-        st.none(),
-        st.text(min_size=10, max_size=30,
-               alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd')))
-    ))
+    transaction_date = draw(_TRANSACTION_DATE)
     
-    return {
-        "flow_id": f"FLOW-{hash(doc_number) % 1000000:012d}",
-        "order_number": order_number,
-        "document_type": doc_type,
-        "document_number": doc_number,
-        "transaction_date": transaction_date,
-        "user_id": user_id,
-        "status": status,
-        "related_document": related_doc
-    }
+    related_doc = draw(RELATED_DOC_TEXT)
+    flow_seq = draw(_FLOW_SEQ)
+    
+    return FlowEntry(
+        flow_id=f"FLOW-{flow_seq:012d}",
+        order_number=order_number,
+        document_type=doc_type,
+        document_number=doc_number,
+        transaction_date=transaction_date,
+        user_id=user_id,
+        status=status,
+        related_document=related_doc
+    )
+
 
+single_entry_strategy = document_flow_entry_strategy()
 
-# Strategy for generating complete order document flow
+
+# Strategies for generating order document flows
 @st.composite
-def complete_order_flow_strategy(draw):
-    """Generate document flow for a complete order (TECO status)"""
-    order_number = draw(st.text(min_size=10, max_size=30,
-                               alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))))
-    order_type = draw(st.sampled_from(list(WorkflowOrderType)))
-    
-    # Generate timestamps in chronological order
-    base_time = datetime.utcnow()
-    
-    # Mandatory document flow entries for TECO order
+def _mandatory_core(draw, order_number, base_time, max_repeats=5):
+    """Generate the mandatory entries of a TECO order in chronological order"""
     flow_entries = []
     
     # 1. Order creation
-    flow_entries.append({
-        "flow_id": f"FLOW-{len(flow_entries):012d}",
-        "order_number": order_number,
-        "document_type": DocumentType.ORDER,
-        "document_number": order_number,
-        "transaction_date": base_time - timedelta(days=10),
-        "user_id": "USER001",
-        "status": WorkflowOrderStatus.CREATED.value,
-        "related_document": None
-    })
+    flow_entries.append(FlowEntry(
+        flow_id=f"FLOW-{len(flow_entries):012d}",
+        order_number=order_number,
+        document_type=DocumentType.ORDER,
+        document_number=order_number,
+        transaction_date=base_time - timedelta(days=10),
+        user_id="USER001",
+        status=WorkflowOrderStatus.CREATED.value,
+        related_document=None
+    ))
     
     # 2. Order release
-    flow_entries.append({
-        "flow_id": f"FLOW-{len(flow_entries):012d}",
-        "order_number": order_number,
-        "document_type": DocumentType.ORDER,
-        "document_number": order_number,
-        "transaction_date": base_time - timedelta(days=8),
-        "user_id": "USER002",
-        "status": WorkflowOrderStatus.RELEASED.value,
-        "related_document": None
-    })
+    flow_entries.append(FlowEntry(
+        flow_id=f"FLOW-{len(flow_entries):012d}",
+        order_number=order_number,
+        document_type=DocumentType.ORDER,
+        document_number=order_number,
+        transaction_date=base_time - timedelta(days=8),
+        user_id="USER002",
+        status=WorkflowOrderStatus.RELEASED.value,
+        related_document=None
+    ))
     
     # 3. Goods Issue (GI)
-    num_gis = draw(st.integers(min_value=1, max_value=5))
+    num_gis = draw(st.integers(min_value=1, max_value=max_repeats))
     for i in range(num_gis):
-        flow_entries.append({
-            "flow_id": f"FLOW-{len(flow_entries):012d}",
-            "order_number": order_number,
-            "document_type": DocumentType.GI,
-            "document_number": f"GI-{i:06d}",
-            "transaction_date": base_time - timedelta(days=6) + timedelta(hours=i),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": order_number
-        })
+        flow_entries.append(FlowEntry(
+            flow_id=f"FLOW-{len(flow_entries):012d}",
+            order_number=order_number,
+            document_type=DocumentType.GI,
+            document_number=f"GI-{i:06d}",
+            transaction_date=base_time - timedelta(days=6) + timedelta(hours=i),
+            user_id=f"USER{i:03d}",
+            status="posted",
+            related_document=order_number
+        ))
     
     # 4. Confirmation
-    num_confirmations = draw(st.integers(min_value=1, max_value=5))
+    num_confirmations = draw(st.integers(min_value=1, max_value=max_repeats))
     for i in range(num_confirmations):
-        flow_entries.append({
-            "flow_id": f"FLOW-{len(flow_entries):012d}",
-            "order_number": order_number,
-            "document_type": DocumentType.CONFIRMATION,
-            "document_number": f"CONF-{i:06d}",
-            "transaction_date": base_time - timedelta(days=4) + timedelta(hours=i),
-            "user_id": f"USER{i:03d}",
-            "status": "confirmed",
-            "related_document": order_number
-        })
+        flow_entries.append(FlowEntry(
+            flow_id=f"FLOW-{len(flow_entries):012d}",
+            order_number=order_number,
+            document_type=DocumentType.CONFIRMATION,
+            document_number=f"CONF-{i:06d}",
+            transaction_date=base_time - timedelta(days=4) + timedelta(hours=i),
+            user_id=f"USER{i:03d}",
+            status="confirmed",
+            related_document=order_number
+        ))
     
     # 5. TECO
-    flow_entries.append({
-        "flow_id": f"FLOW-{len(flow_entries):012d}",
+    flow_entries.append(FlowEntry(
+        flow_id=f"FLOW-{len(flow_entries):012d}",
+        order_number=order_number,
+        document_type=DocumentType.TECO,
+        document_number=order_number,
+        transaction_date=base_time - timedelta(days=1),
+        user_id="USER999",
+        status=WorkflowOrderStatus.TECO.value,
+        related_document=None
+    ))
+    
+    return flow_entries
+
+
+@st.composite
+def _optional_docs(draw, order_number, base_time, first_index):
+    """Generate optional PO and GR entries, numbering flow IDs from first_index"""
+    flow_entries = []
+    
+    # Add PO
+    num_pos = draw(_OPTIONAL_COUNT)
+    for i in range(num_pos):
+        flow_entries.append(FlowEntry(
+            flow_id=f"FLOW-{first_index + len(flow_entries):012d}",
+            order_number=order_number,
+            document_type=DocumentType.PO,
+            document_number=f"PO-{i:06d}",
+            transaction_date=base_time - timedelta(days=9) + timedelta(hours=i),
+            user_id=f"USER{i:03d}",
+            status="created",
+            related_document=order_number
+        ))
+    
+    # Add GR
+    num_grs = draw(_OPTIONAL_COUNT)
+    for i in range(num_grs):
+        flow_entries.append(FlowEntry(
+            flow_id=f"FLOW-{first_index + len(flow_entries):012d}",
+            order_number=order_number,
+            document_type=DocumentType.GR,
+            document_number=f"GR-{i:06d}",
+            transaction_date=base_time - timedelta(days=7) + timedelta(hours=i),
+            user_id=f"USER{i:03d}",
+            status="posted",
+            related_document=f"PO-{i:06d}"
+        ))
+    
+    return flow_entries
+
+
+@st.composite
+def minimal_flow_strategy(draw):
+    """Generate the smallest complete TECO flow: one entry per mandatory step"""
+    order_number = draw(ID_TEXT)
+    order_type = draw(order_type_strategy)
+    flow_entries = draw(_mandatory_core(order_number, datetime.utcnow(), max_repeats=1))
+    
+    return {
         "order_number": order_number,
-        "document_type": DocumentType.TECO,
-        "document_number": order_number,
-        "transaction_date": base_time - timedelta(days=1),
-        "user_id": "USER999",
-        "status": WorkflowOrderStatus.TECO.value,
-        "related_document": None
-    })
-    
-    # Optional entries (PO, GR, SERVICE_ENTRY)
+        "order_type": order_type,
+        "status": WorkflowOrderStatus.TECO,
+        "document_flow": flow_entries
+    }
+
+
+@st.composite
+def complete_order_flow_strategy(draw):
+    """Generate document flow for a complete order (TECO status)"""
+    order_number = draw(ID_TEXT)
+    order_type = draw(order_type_strategy)
+    
+    # Generate timestamps in chronological order
+    base_time = datetime.utcnow()
+    flow_entries = draw(_mandatory_core(order_number, base_time))
+    
+    # Optional entries (PO, GR)
     include_optional = draw(st.booleans())
     if include_optional:
-        # Add PO
-        num_pos = draw(st.integers(min_value=0, max_value=3))
-        for i in range(num_pos):
-            flow_entries.append({
-                "flow_id": f"FLOW-{len(flow_entries):012d}",
-                "order_number": order_number,
-                "document_type": DocumentType.PO,
-                "document_number": f"PO-{i:06d}",
-                "transaction_date": base_time - timedelta(days=9) + timedelta(hours=i),
-                "user_id": f"USER{i:03d}",
-                "status": "created",
-                "related_document": order_number
-            })
-        
-        # Add GR
-        num_grs = draw(st.integers(min_value=0, max_value=3))
-        for i in range(num_grs):
-            flow_entries.append({
-                "flow_id": f"FLOW-{len(flow_entries):012d}",
-                "order_number": order_number,
-                "document_type": DocumentType.GR,
-                "document_number": f"GR-{i:06d}",
-                "transaction_date": base_time - timedelta(days=7) + timedelta(hours=i),
-                "user_id": f"USER{i:03d}",
-                "status": "posted",
-                "related_document": f"PO-{i:06d}"
-            })
+        flow_entries += draw(_optional_docs(order_number, base_time, len(flow_entries)))
     
     # Sort all entries by transaction_date to ensure chronological order
-    flow_entries.sort(key=lambda x: x["transaction_date"])
+    flow_entries.sort(key=attrgetter("transaction_date"))
     
     return {
         "order_number": order_number,
@@ -176,7 +283,7 @@ def complete_order_flow_strategy(draw):
 
 
 @given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_completeness(order_data):
     """
     **Feature: pm-6-screen-workflow, Property 4: Document Flow Completeness**
@@ -200,66 +307,36 @@ def test_property_document_flow_completeness(order_data):
     # Only test TECO orders
     assume(order_status == WorkflowOrderStatus.TECO)
     
-    # Extract document types from flow
-    doc_types = [entry["document_type"] for entry in document_flow]
-    
-    # Define mandatory document types for TECO order
-    mandatory_types = {
-        DocumentType.ORDER,  # Order creation and release
-        DocumentType.GI,     # Goods Issue
-        DocumentType.CONFIRMATION,  # Work confirmation
-        DocumentType.TECO    # Technical completion
-    }
-    
-    # Property 1: All mandatory document types must be present
-    for mandatory_type in mandatory_types:
-        assert mandatory_type in doc_types, \
-            f"TECO order must have {mandatory_type.value} in document flow"
-    
-    # Property 2: Each mandatory type appears at least once
-    for mandatory_type in mandatory_types:
-        count = doc_types.count(mandatory_type)
-        assert count >= 1, \
-            f"TECO order must have at least one {mandatory_type.value} entry"
+    # Property 1 & 2: Each mandatory document type appears at least once
+    counts = Counter(entry.document_type for entry in document_flow)
+    missing = _MANDATORY_TYPES - counts.keys()
+    assert not missing, \
+        f"TECO order must have {sorted(t.value for t in missing)} in document flow"
     
     # Property 3: All entries reference the correct order
     for entry in document_flow:
-        assert entry["order_number"] == order_number, \
+        assert entry.order_number == order_number, \
             f"Document flow entry must reference correct order: {order_number}"
     
-    # Property 4: Document flow entries have valid structure
+    # Property 4: Document flow entries have valid structure (one pass)
     for entry in document_flow:
-        assert "flow_id" in entry and entry["flow_id"], \
-            "Document flow entry must have flow_id"
-        assert "document_type" in entry and entry["document_type"], \
-            "Document flow entry must have document_type"
-        assert "document_number" in entry and entry["document_number"], \
-            "Document flow entry must have document_number"
-        assert "transaction_date" in entry and entry["transaction_date"], \
-            "Document flow entry must have transaction_date"
-        assert "user_id" in entry and entry["user_id"], \
-            "Document flow entry must have user_id"
-        assert "status" in entry and entry["status"], \
-            "Document flow entry must have status"
+        assert all(_REQUIRED_VALUES(entry)), \
+            f"Document flow entry must have {', '.join(_REQUIRED_FIELDS)}: {entry}"
     
     # Property 5: Chronological ordering (timestamps should be in order)
-    timestamps = [entry["transaction_date"] for entry in document_flow]
-    sorted_timestamps = sorted(timestamps)
-    assert timestamps == sorted_timestamps, \
-        "Document flow entries should be in chronological order"
+    _assert_sorted(entry.transaction_date for entry in document_flow)
     
     # Property 6: TECO entry is the last entry
     last_entry = document_flow[-1]
-    assert last_entry["document_type"] == DocumentType.TECO, \
+    assert last_entry.document_type == DocumentType.TECO, \
         "TECO entry should be the last entry in document flow"
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     num_entries=st.integers(min_value=1, max_value=20)
 )
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_order_reference(order_number, num_entries):
     """
     Property: All document flow entries must reference the correct order
@@ -271,30 +348,20 @@ def test_property_document_flow_order_reference(order_number, num_entries):
     """
     
     # Generate document flow entries for the order
-    flow_entries = []
-    for i in range(num_entries):
-        doc_type = DocumentType.ORDER if i == 0 else DocumentType.GI
-        entry = {
-            "flow_id": f"FLOW-{i:012d}",
-            "order_number": order_number,
-            "document_type": doc_type,
-            "document_number": f"DOC-{i:06d}",
-            "transaction_date": datetime.utcnow(),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": None
-        }
-        flow_entries.append(entry)
+    flow_entries = [
+        _make_entry(i, order_number, DocumentType.ORDER if i == 0 else DocumentType.GI)
+        for i in range(num_entries)
+    ]
     
     # Property 1: Every entry has order_number field
     for entry in flow_entries:
-        assert "order_number" in entry, \
+        assert "order_number" in entry._fields, \
             "Every document flow entry must have order_number field"
-        assert entry["order_number"] is not None, \
+        assert entry.order_number is not None, \
             "Document flow entry order_number must not be None"
     
     # Property 2: All entries reference the same order
-    order_refs = [entry["order_number"] for entry in flow_entries]
+    order_refs = [entry.order_number for entry in flow_entries]
     assert all(ref == order_number for ref in order_refs), \
         "All document flow entries must reference the same order"
     
@@ -304,7 +371,7 @@ def test_property_document_flow_order_reference(order_number, num_entries):
 
 
 @given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
+@FAST
 def test_property_mandatory_transaction_sequence(order_data):
     """
     Property: Mandatory transactions must occur in logical sequence
@@ -325,17 +392,20 @@ def test_property_mandatory_transaction_sequence(order_data):
     first_confirmation_idx = None
     teco_idx = None
     
+    created = WorkflowOrderStatus.CREATED.value
+    released = WorkflowOrderStatus.RELEASED.value
+    
     for idx, entry in enumerate(document_flow):
-        if entry["document_type"] == DocumentType.ORDER:
-            if entry["status"] == WorkflowOrderStatus.CREATED.value and order_creation_idx is None:
+        if entry.document_type == DocumentType.ORDER:
+            if entry.status == created and order_creation_idx is None:
                 order_creation_idx = idx
-            elif entry["status"] == WorkflowOrderStatus.RELEASED.value and order_release_idx is None:
+            elif entry.status == released and order_release_idx is None:
                 order_release_idx = idx
-        elif entry["document_type"] == DocumentType.GI and first_gi_idx is None:
+        elif entry.document_type == DocumentType.GI and first_gi_idx is None:
             first_gi_idx = idx
-        elif entry["document_type"] == DocumentType.CONFIRMATION and first_confirmation_idx is None:
+        elif entry.document_type == DocumentType.CONFIRMATION and first_confirmation_idx is None:
             first_confirmation_idx = idx
-        elif entry["document_type"] == DocumentType.TECO and teco_idx is None:
+        elif entry.document_type == DocumentType.TECO and teco_idx is None:
             teco_idx = idx
     
     # Property 1: Order creation comes before release
@@ -365,12 +435,11 @@ def test_property_mandatory_transaction_sequence(order_data):
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     doc_type=document_type_strategy,
     num_entries=st.integers(min_value=1, max_value=10)
 )
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_entry_uniqueness(order_number, doc_type, num_entries):
     """
     Property: Each document flow entry must have a unique flow_id
@@ -382,31 +451,19 @@ def test_property_document_flow_entry_uniqueness(order_number, doc_type, num_ent
     """
     
     # Generate multiple entries
-    flow_entries = []
-    for i in range(num_entries):
-        entry = {
-            "flow_id": f"FLOW-{i:012d}",
-            "order_number": order_number,
-            "document_type": doc_type,
-            "document_number": f"DOC-{i:06d}",
-            "transaction_date": datetime.utcnow(),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": None
-        }
-        flow_entries.append(entry)
+    flow_entries = [_make_entry(i, order_number, doc_type) for i in range(num_entries)]
     
     # Property 1: Every entry has a flow_id
     for entry in flow_entries:
-        assert "flow_id" in entry, \
+        assert "flow_id" in entry._fields, \
             "Every document flow entry must have flow_id"
-        assert entry["flow_id"], \
+        assert entry.flow_id, \
             "Flow ID must not be empty"
-        assert isinstance(entry["flow_id"], str), \
+        assert isinstance(entry.flow_id, str), \
             "Flow ID must be a string"
     
     # Property 2: All flow IDs are unique
-    flow_ids = [entry["flow_id"] for entry in flow_entries]
+    flow_ids = [entry.flow_id for entry in flow_entries]
     assert len(flow_ids) == len(set(flow_ids)), \
         "All flow IDs must be unique"
     
@@ -415,8 +472,8 @@ def test_property_document_flow_entry_uniqueness(order_number, doc_type, num_ent
         "Number of flow IDs must match number of entries"
 
 
-@given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
+@given(order_data=minimal_flow_strategy())
+@FAST
 def test_property_document_flow_timestamps_valid(order_data):
     """
     Property: Document flow timestamps must be valid and reasonable
@@ -433,116 +490,53 @@ def test_property_document_flow_timestamps_valid(order_data):
     
     # Property 1: All timestamps are datetime objects
     for entry in document_flow:
-        assert isinstance(entry["transaction_date"], datetime), \
+        assert isinstance(entry.transaction_date, datetime), \
             "Transaction date must be a datetime object"
     
     # Property 2: Timestamps are not in the future
     for entry in document_flow:
-        assert entry["transaction_date"] <= current_time, \
+        assert entry.transaction_date <= current_time, \
             "Transaction date must not be in the future"
     
     # Property 3: Timestamps are in chronological order
-    timestamps = [entry["transaction_date"] for entry in document_flow]
-    for i in range(len(timestamps) - 1):
-        assert timestamps[i] <= timestamps[i + 1], \
-            "Timestamps must be in chronological order"
+    _assert_sorted(entry.transaction_date for entry in document_flow)
     
     # Property 4: Timestamps are within reasonable range (not too old)
     # Assume orders don't span more than 1 year
     one_year_ago = current_time - timedelta(days=365)
     for entry in document_flow:
-        assert entry["transaction_date"] >= one_year_ago, \
+        assert entry.transaction_date >= one_year_ago, \
             "Transaction date should be within reasonable range (1 year)"
 
 
-@given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
-    doc_type=document_type_strategy
-)
-@settings(max_examples=100)
-def test_property_document_flow_user_tracking(order_number, doc_type):
+@pytest.mark.parametrize("field", ["user_id", "status", "flow_id", "document_number"])
+@given(entry=single_entry_strategy)
+@TRIVIAL
+def test_property_document_flow_field_tracking(field, entry):
     """
-    Property: Document flow must track user for audit purposes
+    Property: Document flow must track user and status for audit purposes
     
-    This test verifies that:
-    1. Every entry has a user_id
-    2. User ID is non-empty
-    3. User ID is a valid string
-    """
-    
-    # Generate document flow entry
-    entry = {
-        "flow_id": f"FLOW-{hash(order_number) % 1000000:012d}",
-        "order_number": order_number,
-        "document_type": doc_type,
-        "document_number": f"DOC-{hash(order_number) % 1000000:06d}",
-        "transaction_date": datetime.utcnow(),
-        "user_id": "USER001",
-        "status": "posted",
-        "related_document": None
-    }
-    
-    # Property 1: Entry has user_id field
-    assert "user_id" in entry, \
-        "Document flow entry must have user_id field"
-    
-    # Property 2: User ID is not empty
-    assert entry["user_id"], \
-        "User ID must not be empty"
-    
-    # Property 3: User ID is a string
-    assert isinstance(entry["user_id"], str), \
-        "User ID must be a string"
-    
-    # Property 4: User ID has reasonable length
-    assert len(entry["user_id"]) > 0, \
-        "User ID must have non-zero length"
-
-
-@given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
-def test_property_document_flow_status_tracking(order_data):
-    """
-    Property: Document flow must track status for each transaction
-    
-    This test verifies that:
-    1. Every entry has a status field
-    2. Status is non-empty
-    3. Status provides meaningful information
+    This test verifies that for every entry:
+    1. user_id, status, flow_id and document_number are strings
+    2. Each of them is non-empty
+    3. Each of them has a reasonable length
     """
+    value = getattr(entry, field)
     
-    document_flow = order_data["document_flow"]
-    
-    # Property 1: Every entry has status field
-    for entry in document_flow:
-        assert "status" in entry, \
-            "Document flow entry must have status field"
-    
-    # Property 2: Status is not empty
-    for entry in document_flow:
-        assert entry["status"], \
-            "Status must not be empty"
-        assert isinstance(entry["status"], str), \
-            "Status must be a string"
-    
-    # Property 3: Status has reasonable length
-    for entry in document_flow:
-        assert len(entry["status"]) > 0, \
-            "Status must have non-zero length"
-        assert len(entry["status"]) <= 100, \
-            "Status should not be excessively long"
+    assert isinstance(value, str) and value, \
+        f"{field} must be a non-empty string"
+    assert len(value) <= 100, \
+        f"{field} should not be excessively long"
 
 
 
 # Property 10: Audit Trail Immutability Tests
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     doc_type=document_type_strategy
 )
-@settings(max_examples=100)
+@TRIVIAL
 def test_property_audit_trail_immutability(order_number, doc_type):
     """
     **Feature: pm-6-screen-workflow, Property 10: Audit Trail Immutability**
@@ -559,64 +553,39 @@ def test_property_audit_trail_immutability(order_number, doc_type):
     """
     
     # Create original document flow entry
-    original_entry = {
-        "flow_id": f"FLOW-{hash(order_number) % 1000000:012d}",
-        "order_number": order_number,
-        "document_type": doc_type,
-        "document_number": f"DOC-{hash(order_number) % 1000000:06d}",
-        "transaction_date": datetime.utcnow(),
-        "user_id": "USER001",
-        "status": "posted",
-        "related_document": None
-    }
+    original_entry = _make_entry(1, order_number, doc_type)
     
-    # Create a copy to simulate the "posted" state
-    posted_entry = original_entry.copy()
+    # Posting hands out the same immutable entry, no copy needed
+    posted_entry = original_entry
     
-    # Property 1: All fields must match after posting
-    for key in original_entry:
-        assert posted_entry[key] == original_entry[key], \
-            f"Field {key} must remain unchanged after posting"
+    # Property 1: All fields (flow ID, order reference, transaction date,
+    # user ID, ...) must match after posting
+    assert posted_entry == original_entry, \
+        "All fields must remain unchanged after posting"
     
     # Property 2: Entry structure is preserved
-    assert set(posted_entry.keys()) == set(original_entry.keys()), \
+    assert posted_entry._fields == original_entry._fields, \
         "Entry structure must remain unchanged"
     
-    # Property 3: Immutability check - simulate modification attempt
-    # In a real system, this would be enforced by database constraints
-    # Here we verify that the original values are preserved
-    modified_entry = posted_entry.copy()
-    modified_entry["status"] = "modified"
+    # Property 3: Immutability check - fields cannot be reassigned in place
+    with pytest.raises(AttributeError):
+        posted_entry.status = "modified"
+    
+    # A modification attempt can only produce a new entry
+    modified_entry = posted_entry._replace(status="modified")
     
     # The original posted entry should remain unchanged
-    assert posted_entry["status"] == original_entry["status"], \
+    assert posted_entry.status == "posted", \
         "Original entry must not be affected by modification attempts"
-    assert posted_entry["status"] != modified_entry["status"], \
+    assert posted_entry != modified_entry, \
         "Modified copy should differ from original"
-    
-    # Property 4: Flow ID is immutable
-    assert posted_entry["flow_id"] == original_entry["flow_id"], \
-        "Flow ID must never change"
-    
-    # Property 5: Order reference is immutable
-    assert posted_entry["order_number"] == original_entry["order_number"], \
-        "Order number reference must never change"
-    
-    # Property 6: Transaction date is immutable
-    assert posted_entry["transaction_date"] == original_entry["transaction_date"], \
-        "Transaction date must never change"
-    
-    # Property 7: User ID is immutable
-    assert posted_entry["user_id"] == original_entry["user_id"], \
-        "User ID must never change"
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     num_entries=st.integers(min_value=1, max_value=10)
 )
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_immutability_across_entries(order_number, num_entries):
     """
     Property: Document flow immutability applies to all entries
@@ -628,22 +597,10 @@ def test_property_document_flow_immutability_across_entries(order_number, num_en
     """
     
     # Create multiple document flow entries
-    entries = []
-    for i in range(num_entries):
-        entry = {
-            "flow_id": f"FLOW-{i:012d}",
-            "order_number": order_number,
-            "document_type": DocumentType.ORDER,
-            "document_number": f"DOC-{i:06d}",
-            "transaction_date": datetime.utcnow(),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": None
-        }
-        entries.append(entry)
+    entries = [_make_entry(i, order_number, DocumentType.ORDER) for i in range(num_entries)]
     
     # Store original values
-    original_entries = [entry.copy() for entry in entries]
+    original_entries = list(entries)
     
     # Property 1: Entry count is immutable
     assert len(entries) == num_entries, \
@@ -651,24 +608,29 @@ def test_property_document_flow_immutability_across_entries(order_number, num_en
     
     # Property 2: Each entry maintains its identity
     for i, entry in enumerate(entries):
-        assert entry["flow_id"] == original_entries[i]["flow_id"], \
+        assert entry.flow_id == original_entries[i].flow_id, \
             f"Entry {i} flow_id must remain unchanged"
-        assert entry["order_number"] == original_entries[i]["order_number"], \
+        assert entry.order_number == original_entries[i].order_number, \
             f"Entry {i} order_number must remain unchanged"
     
     # Property 3: Simulating modification of one entry doesn't affect others
     if len(entries) > 1:
-        modified_entry = entries[0].copy()
-        modified_entry["status"] = "modified"
+        modified_entry = entries[0]._replace(status="modified")
+        
+        # The modification yields a new entry and leaves entry 0 posted
+        assert modified_entry != entries[0], \
+            "Modified copy should differ from original"
+        assert entries[0].status == "posted", \
+            "Entry 0 must not be affected by modification attempts"
         
         # Other entries should remain unchanged
         for i in range(1, len(entries)):
-            assert entries[i]["status"] == original_entries[i]["status"], \
+            assert entries[i].status == original_entries[i].status, \
                 f"Entry {i} should not be affected by modification of entry 0"
 
 
-@given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
+@given(order_data=minimal_flow_strategy())
+@FAST
 def test_property_document_flow_historical_integrity(order_data):
     """
     Property: Document flow maintains historical integrity
@@ -683,44 +645,38 @@ def test_property_document_flow_historical_integrity(order_data):
     document_flow = order_data["document_flow"]
     
     # Property 1: Flow is complete (no gaps in flow IDs)
-    flow_ids = [entry["flow_id"] for entry in document_flow]
+    flow_ids = [entry.flow_id for entry in document_flow]
     assert len(flow_ids) == len(set(flow_ids)), \
         "All flow IDs must be unique (no duplicates)"
     
     # Property 2: All entries have timestamps
     for entry in document_flow:
-        assert entry["transaction_date"] is not None, \
+        assert entry.transaction_date is not None, \
             "Every entry must have a transaction date"
-        assert isinstance(entry["transaction_date"], datetime), \
+        assert isinstance(entry.transaction_date, datetime), \
             "Transaction date must be a datetime object"
     
     # Property 3: Chronological order is preserved
-    timestamps = [entry["transaction_date"] for entry in document_flow]
-    for i in range(len(timestamps) - 1):
-        assert timestamps[i] <= timestamps[i + 1], \
-            "Timestamps must be in chronological order"
+    _assert_sorted(entry.transaction_date for entry in document_flow)
     
     # Property 4: All entries reference the same order
     order_number = order_data["order_number"]
     for entry in document_flow:
-        assert entry["order_number"] == order_number, \
+        assert entry.order_number == order_number, \
             "All entries must reference the same order"
     
     # Property 5: Mandatory transaction types are present
-    doc_types = [entry["document_type"] for entry in document_flow]
-    mandatory_types = {DocumentType.ORDER, DocumentType.GI, 
-                      DocumentType.CONFIRMATION, DocumentType.TECO}
-    for mandatory_type in mandatory_types:
-        assert mandatory_type in doc_types, \
-            f"Mandatory transaction type {mandatory_type.value} must be present"
+    present_types = {entry.document_type for entry in document_flow}
+    missing = _MANDATORY_TYPES - present_types
+    assert not missing, \
+        f"Mandatory transaction types {sorted(t.value for t in missing)} must be present"
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     doc_type=document_type_strategy
 )
-@settings(max_examples=100)
+@TRIVIAL
 def test_property_document_flow_entry_cannot_be_deleted(order_number, doc_type):
     """
     Property: Document flow entries cannot be deleted
@@ -732,32 +688,20 @@ def test_property_document_flow_entry_cannot_be_deleted(order_number, doc_type):
     """
     
     # Create document flow with entries
-    entries = []
-    for i in range(3):
-        entry = {
-            "flow_id": f"FLOW-{i:012d}",
-            "order_number": order_number,
-            "document_type": doc_type,
-            "document_number": f"DOC-{i:06d}",
-            "transaction_date": datetime.utcnow(),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": None
-        }
-        entries.append(entry)
+    entries = [_make_entry(i, order_number, doc_type) for i in range(3)]
     
     original_count = len(entries)
-    original_flow_ids = [entry["flow_id"] for entry in entries]
+    original_flow_ids = [entry.flow_id for entry in entries]
     
     # Property 1: Entry count cannot decrease
     assert len(entries) == original_count, \
         "Entry count must not decrease"
     
     # Property 2: All original flow IDs must still exist
-    current_flow_ids = [entry["flow_id"] for entry in entries]
-    for flow_id in original_flow_ids:
-        assert flow_id in current_flow_ids, \
-            f"Original flow ID {flow_id} must still exist"
+    current_flow_ids = {entry.flow_id for entry in entries}
+    missing = set(original_flow_ids) - current_flow_ids
+    assert not missing, \
+        f"Original flow IDs {sorted(missing)} must still exist"
     
     # Property 3: Simulating deletion attempt
     # In a real system, this would be prevented by database constraints
@@ -768,17 +712,16 @@ def test_property_document_flow_entry_cannot_be_deleted(order_number, doc_type):
         "All entries must remain after deletion attempt"
     
     for i, entry in enumerate(entries_after_deletion_attempt):
-        assert entry["flow_id"] == original_flow_ids[i], \
+        assert entry.flow_id == original_flow_ids[i], \
             f"Entry {i} must still exist with original flow_id"
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     doc_type=document_type_strategy,
     num_modifications=st.integers(min_value=1, max_value=10)
 )
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_resists_modification_attempts(order_number, doc_type, num_modifications):
     """
     Property: Document flow entries resist modification attempts
@@ -790,45 +733,28 @@ def test_property_document_flow_resists_modification_attempts(order_number, doc_
     """
     
     # Create original entry
-    original_entry = {
-        "flow_id": f"FLOW-{hash(order_number) % 1000000:012d}",
-        "order_number": order_number,
-        "document_type": doc_type,
-        "document_number": f"DOC-{hash(order_number) % 1000000:06d}",
-        "transaction_date": datetime.utcnow(),
-        "user_id": "USER001",
-        "status": "posted",
-        "related_document": None
-    }
+    original_entry = _make_entry(1, order_number, doc_type)
     
     # Store original values
-    original_values = original_entry.copy()
+    original_values = original_entry._asdict()
     
-    # Simulate multiple modification attempts
+    # Simulate multiple modification attempts; each one can only produce a new entry
+    modified_copy = original_entry
     for i in range(num_modifications):
-        # Create a modified copy (simulating modification attempt)
-        modified_copy = original_entry.copy()
-        modified_copy["status"] = f"modified_{i}"
-        modified_copy["user_id"] = f"HACKER{i:03d}"
-        
-        # Verify original entry remains unchanged
-        assert original_entry["status"] == original_values["status"], \
-            f"Original status must remain unchanged after modification attempt {i}"
-        assert original_entry["user_id"] == original_values["user_id"], \
-            f"Original user_id must remain unchanged after modification attempt {i}"
-        assert original_entry["flow_id"] == original_values["flow_id"], \
-            f"Original flow_id must remain unchanged after modification attempt {i}"
-        assert original_entry["order_number"] == original_values["order_number"], \
-            f"Original order_number must remain unchanged after modification attempt {i}"
-    
-    # Property: After all modification attempts, original entry is intact
-    for key in original_values:
-        assert original_entry[key] == original_values[key], \
+        modified_copy = modified_copy._replace(status=f"modified_{i}", user_id=f"HACKER{i:03d}")
+        assert modified_copy != original_entry, \
+            f"Modification attempt {i} should produce an entry that differs from the original"
+    
+    # Property: After all modification attempts, original entry is intact.
+    # Nothing in the loop touches original_entry, so checking once afterwards
+    # covers every attempt.
+    for key, value in original_values.items():
+        assert getattr(original_entry, key) == value, \
             f"Field {key} must remain unchanged after {num_modifications} modification attempts"
 
 
 @given(order_data=complete_order_flow_strategy())
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_append_only(order_data):
     """
     Property: Document flow is append-only
@@ -844,19 +770,18 @@ def test_property_document_flow_append_only(order_data):
     order_number = order_data["order_number"]
     
     original_count = len(document_flow)
-    original_flow_ids = [entry["flow_id"] for entry in document_flow]
+    original_flow_ids = [entry.flow_id for entry in document_flow]
     
     # Simulate adding a new entry (append operation)
-    new_entry = {
-        "flow_id": f"FLOW-{original_count:012d}",
-        "order_number": order_number,
-        "document_type": DocumentType.ORDER,
-        "document_number": f"DOC-NEW",
-        "transaction_date": datetime.utcnow(),
-        "user_id": "USER_NEW",
-        "status": "new_status",
-        "related_document": None
-    }
+    new_entry = FlowEntry(
+        flow_id=f"FLOW-{original_count:012d}",
+        order_number=order_number,
+        document_type=DocumentType.ORDER,
+        document_number=f"DOC-NEW",
+        transaction_date=datetime.utcnow(),
+        user_id="USER_NEW",
+        status="new_status"
+    )
     
     # Add new entry
     updated_flow = document_flow + [new_entry]
@@ -865,29 +790,29 @@ def test_property_document_flow_append_only(order_data):
     assert len(updated_flow) == original_count + 1, \
         "Entry count must increase by exactly 1 when adding new entry"
     
-    # Property 2: All original entries are still present and unchanged
+    # Property 2: All original entries are still present and unchanged;
+    # concatenation shares the original objects, so identity suffices
     for i in range(original_count):
-        assert updated_flow[i]["flow_id"] == original_flow_ids[i], \
+        assert updated_flow[i].flow_id == original_flow_ids[i], \
             f"Original entry {i} must remain unchanged"
-        assert updated_flow[i] == document_flow[i], \
+        assert updated_flow[i] is document_flow[i], \
             f"Original entry {i} must be identical to original"
     
     # Property 3: New entry is at the end
-    assert updated_flow[-1]["flow_id"] == new_entry["flow_id"], \
+    assert updated_flow[-1].flow_id == new_entry.flow_id, \
         "New entry must be appended at the end"
     
     # Property 4: All entries still reference the same order
     for entry in updated_flow:
-        assert entry["order_number"] == order_number, \
+        assert entry.order_number == order_number, \
             "All entries must reference the same order"
 
 
 @given(
-    order_number=st.text(min_size=10, max_size=30,
-                        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Pd'))),
+    order_number=ID_TEXT,
     num_entries=st.integers(min_value=2, max_value=10)
 )
-@settings(max_examples=100)
+@FAST
 def test_property_document_flow_no_retroactive_changes(order_number, num_entries):
     """
     Property: Document flow does not allow retroactive changes
@@ -898,44 +823,35 @@ def test_property_document_flow_no_retroactive_changes(order_number, num_entries
     3. Historical record is preserved
     """
     
-    # Create document flow with entries at different times
-    base_time = datetime.utcnow()
+    # Create document flow with entries one day apart, ending yesterday
+    one_day = timedelta(days=1)
+    transaction_date = datetime.utcnow() - num_entries * one_day
     entries = []
     
     for i in range(num_entries):
-        entry = {
-            "flow_id": f"FLOW-{i:012d}",
-            "order_number": order_number,
-            "document_type": DocumentType.ORDER,
-            "document_number": f"DOC-{i:06d}",
-            "transaction_date": base_time - timedelta(days=num_entries - i),
-            "user_id": f"USER{i:03d}",
-            "status": "posted",
-            "related_document": None
-        }
-        entries.append(entry)
+        entry = _make_entry(i, order_number, DocumentType.ORDER)
+        entries.append(entry._replace(transaction_date=transaction_date))
+        transaction_date += one_day
     
     # Store original timestamps
-    original_timestamps = [entry["transaction_date"] for entry in entries]
+    original_timestamps = [entry.transaction_date for entry in entries]
     
     # Property 1: Timestamps cannot be changed
     for i, entry in enumerate(entries):
-        assert entry["transaction_date"] == original_timestamps[i], \
+        assert entry.transaction_date == original_timestamps[i], \
             f"Timestamp for entry {i} must not change"
     
     # Property 2: Chronological order is preserved
     for i in range(len(entries) - 1):
-        assert entries[i]["transaction_date"] <= entries[i + 1]["transaction_date"], \
+        assert entries[i].transaction_date <= entries[i + 1].transaction_date, \
             "Chronological order must be preserved"
     
     # Property 3: Simulating retroactive change attempt
     # Try to change an old entry's timestamp
-    if len(entries) > 1:
-        old_entry_copy = entries[0].copy()
-        old_entry_copy["transaction_date"] = datetime.utcnow()
-        
-        # Original entry should remain unchanged
-        assert entries[0]["transaction_date"] == original_timestamps[0], \
-            "Original entry timestamp must not change"
-        assert entries[0]["transaction_date"] != old_entry_copy["transaction_date"], \
-            "Modified copy should differ from original"
+    old_entry_copy = entries[0]._replace(transaction_date=datetime.utcnow())
+    
+    # Original entry should remain unchanged
+    assert entries[0].transaction_date == original_timestamps[0], \
+        "Original entry timestamp must not change"
+    assert entries[0].transaction_date != old_entry_copy.transaction_date, \
+        "Modified copy should differ from original"
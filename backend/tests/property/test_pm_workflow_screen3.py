@@ -2,246 +2,241 @@
 Property-based tests for PM Workflow Screen 3: Order Release & Execution Readiness
 Feature: pm-6-screen-workflow
 """
+import functools
+from types import SimpleNamespace
+
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, settings, assume, HealthCheck, Phase
 from backend.models.pm_workflow_models import WorkflowOrderStatus
 from backend.services.pm_workflow_state_machine import get_state_machine
 
 
-# Strategy for generating permit data
-@st.composite
-def permit_strategy(draw):
-    """Generate random permit data"""
+# The state machine is a stateless singleton; resolve it once per module
+_STATE_MACHINE = get_state_machine()
+
+
+def _freeze(order_data):
+    """Canonical hashable form of a Screen 3 order"""
+    return (
+        order_data["order_type"],
+        tuple(tuple(sorted(op.items())) for op in order_data["operations"]),
+        tuple(tuple(sorted(c.items())) for c in order_data["components"]),
+        tuple(tuple(sorted(p.items())) for p in order_data["permits"]),
+        tuple(sorted(order_data["cost_summary"].items())),
+    )
+
+
+def _thaw(frozen):
+    """Rebuild the order dict from its frozen form"""
+    order_type, operations, components, permits, cost_summary = frozen
     return {
-        "permit_id": draw(st.text(min_size=5, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))),
-        "permit_type": draw(st.sampled_from(["safety", "environmental", "access", "hot_work"])),
-        "required": draw(st.booleans()),
-        "approved": draw(st.booleans()),
-        "approver": draw(st.text(min_size=3, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll')))),
+        "order_type": order_type,
+        "operations": [dict(op) for op in operations],
+        "components": [dict(c) for c in components],
+        "permits": [dict(p) for p in permits],
+        "confirmations": [],
+        "cost_summary": dict(cost_summary),
     }
 
 
-# Strategy for generating component/material data
-@st.composite
-def component_strategy(draw):
-    """Generate random component data"""
-    qty_required = draw(st.floats(min_value=1.0, max_value=1000.0))
-    qty_issued = draw(st.floats(min_value=0.0, max_value=qty_required))
-    
+@functools.lru_cache(maxsize=4096)
+def _cached_can_transition(frozen):
+    """Planned -> Released check, memoized across Hypothesis replays"""
+    can_transition, blocking_reasons = _STATE_MACHINE.can_transition(
+        WorkflowOrderStatus.PLANNED,
+        WorkflowOrderStatus.RELEASED,
+        _thaw(frozen)
+    )
+    return can_transition, tuple(blocking_reasons)
+
+
+_REASON_KINDS = ("permit", "material", "technician")
+
+
+def _classify(reasons):
+    """Flag which prerequisite categories appear in the blocking reasons"""
+    kinds = dict.fromkeys(_REASON_KINDS + ("other",), False)
+    for reason in reasons:
+        lowered = reason.lower()
+        matched = False
+        for kind in _REASON_KINDS:
+            if kind in lowered:
+                kinds[kind] = matched = True
+        if not matched:
+            kinds["other"] = True
+    return kinds
+
+
+@functools.lru_cache(maxsize=4096)
+def _derive(frozen):
+    """Order facts the Screen 3 properties branch on, shared across tests and replays"""
+    order_type, operations, components, permits, _ = frozen
+    operations = [dict(op) for op in operations]
+    components = [dict(c) for c in components]
+    permits = [dict(p) for p in permits]
+    return SimpleNamespace(
+        is_breakdown=order_type == "breakdown",
+        has_permits=bool(permits),
+        has_required_permits=any(p["required"] for p in permits),
+        has_unapproved_permits=any(p["required"] and not p["approved"] for p in permits),
+        has_components=bool(components),
+        has_critical=any(c["critical"] for c in components),
+        has_unavailable_critical=any(
+            c["critical"] and not c["available"] and not c["on_order"] for c in components
+        ),
+        has_technician=any(op["technician_id"] for op in operations),
+    )
+
+
+# These properties are green in CI; skip the shrink/explain phases and pin the
+# seed so runs are deterministic and bounded
+FAST = settings(
+    max_examples=100,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate),
+    deadline=None,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow]
+)
+
+
+# ASCII alphabets avoid Unicode category lookups on every drawn character
+_DIGITS = "0123456789"
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LETTERS = _UPPER + _UPPER.lower()
+_ALPHANUMERIC = _LETTERS + _DIGITS
+_UPPER_ALPHANUMERIC = _UPPER + _DIGITS
+
+
+# Strategy for generating permit data
+permit_strategy = st.fixed_dictionaries({
+    "permit_id": st.text(min_size=5, max_size=20, alphabet=_ALPHANUMERIC),
+    "permit_type": st.sampled_from(["safety", "environmental", "access", "hot_work"]),
+    "required": st.booleans(),
+    "approved": st.booleans(),
+    "approver": st.text(min_size=3, max_size=20, alphabet=_LETTERS),
+})
+
+
+# Strategy for generating component/material data; the issued quantity is
+# bounded by the required quantity, so the pair is drawn together
+_QUANTITIES = st.floats(min_value=1.0, max_value=1000.0).flatmap(
+    lambda qty_required: st.tuples(st.just(qty_required), st.floats(min_value=0.0, max_value=qty_required))
+)
+
+
+def _component(component_id, material_number, quantities, critical, available, on_order):
+    """Assemble a component dict from its drawn fields"""
+    qty_required, qty_issued = quantities
     return {
-        "component_id": draw(st.text(min_size=5, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))),
-        "material_number": draw(st.text(min_size=5, max_size=15, alphabet=st.characters(whitelist_categories=('Lu', 'Nd')))),
+        "component_id": component_id,
+        "material_number": material_number,
         "quantity_required": qty_required,
         "quantity_issued": qty_issued,
-        "critical": draw(st.booleans()),
-        "available": draw(st.booleans()),
-        "on_order": draw(st.booleans()),
+        "critical": critical,
+        "available": available,
+        "on_order": on_order,
     }
 
 
+component_strategy = st.builds(
+    _component,
+    component_id=st.text(min_size=5, max_size=20, alphabet=_ALPHANUMERIC),
+    material_number=st.text(min_size=5, max_size=15, alphabet=_UPPER_ALPHANUMERIC),
+    quantities=_QUANTITIES,
+    critical=st.booleans(),
+    available=st.booleans(),
+    on_order=st.booleans(),
+)
+
+
 # Strategy for generating operation data
-@st.composite
-def operation_strategy(draw):
-    """Generate random operation data"""
-    return {
-        "operation_id": draw(st.text(min_size=5, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))),
-        "operation_number": draw(st.text(min_size=2, max_size=10, alphabet="0123456789")),
-        "status": draw(st.sampled_from(["planned", "in_progress", "confirmed"])),
-        "technician_id": draw(st.one_of(st.none(), st.text(min_size=3, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))))),
-    }
+operation_strategy = st.fixed_dictionaries({
+    "operation_id": st.text(min_size=5, max_size=20, alphabet=_ALPHANUMERIC),
+    "operation_number": st.text(min_size=2, max_size=10, alphabet=_DIGITS),
+    "status": st.sampled_from(["planned", "in_progress", "confirmed"]),
+    "technician_id": st.one_of(st.none(), st.text(min_size=3, max_size=20, alphabet=_ALPHANUMERIC)),
+})
+
+
+# Inner order strategies, shared by every screen3_order_strategy() instance
+_ORDER_TYPE = st.sampled_from(["general", "breakdown"])
+_OPERATIONS = st.lists(operation_strategy, min_size=1, max_size=5)
+_COMPONENTS = st.lists(component_strategy, max_size=5)
+_PERMITS = st.lists(permit_strategy, max_size=3)
+_CONFIRMATIONS = st.builds(list)
+_COST_SUMMARY = st.fixed_dictionaries({
+    "estimated_total_cost": st.floats(min_value=100.0, max_value=100000.0)
+})
 
 
 # Strategy for generating order data for Screen 3
-@st.composite
-def screen3_order_strategy(draw, order_type=None):
+def screen3_order_strategy(order_type=None):
     """Generate random order data for Screen 3 testing"""
-    if order_type is None:
-        order_type = draw(st.sampled_from(["general", "breakdown"]))
-    
-    num_operations = draw(st.integers(min_value=1, max_value=5))
-    operations = [draw(operation_strategy()) for _ in range(num_operations)]
-    
-    num_components = draw(st.integers(min_value=0, max_value=5))
-    components = [draw(component_strategy()) for _ in range(num_components)]
-    
-    num_permits = draw(st.integers(min_value=0, max_value=3))
-    permits = [draw(permit_strategy()) for _ in range(num_permits)]
-    
-    return {
-        "order_type": order_type,
-        "operations": operations,
-        "components": components,
-        "permits": permits,
-        "confirmations": [],
-        "cost_summary": {"estimated_total_cost": draw(st.floats(min_value=100.0, max_value=100000.0))}
-    }
+    return st.fixed_dictionaries({
+        "order_type": _ORDER_TYPE if order_type is None else st.just(order_type),
+        "operations": _OPERATIONS,
+        "components": _COMPONENTS,
+        "permits": _PERMITS,
+        "confirmations": _CONFIRMATIONS,
+        "cost_summary": _COST_SUMMARY,
+    })
 
 
-@given(order_data=screen3_order_strategy())
-@settings(max_examples=100)
-def test_property_permit_enforcement(order_data):
-    """
-    **Feature: pm-6-screen-workflow, Property 7: Permit Enforcement**
-    **Validates: Requirements 1.6, 3.1**
-    
-    Property: For any maintenance order with permit requirements,
-    the order should not transition to "Released" status unless all
-    required permits are approved.
-    
-    This test verifies that:
-    1. Orders with unapproved required permits cannot be released
-    2. Orders with all required permits approved can be released (if other prerequisites met)
-    3. Breakdown orders have reduced permit validation
-    4. Optional permits don't block release
-    """
-    state_machine = get_state_machine()
-    
-    # Check if order can transition from Planned to Released
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        order_data
-    )
-    
-    is_breakdown = order_data.get("order_type") == "breakdown"
-    permits = order_data.get("permits", [])
-    required_permits = [p for p in permits if p.get("required", False)]
-    
-    # Property 1: For general maintenance, required permits must be approved
-    if not is_breakdown and required_permits:
-        unapproved_required = [p for p in required_permits if not p.get("approved", False)]
-        
-        if unapproved_required:
-            # Order should be blocked
-            assert not can_transition or len(blocking_reasons) > 0, \
-                "Order with unapproved required permits should be blocked or have warnings"
-            
-            # If blocked, reason should mention permits
-            if not can_transition:
-                assert any("permit" in reason.lower() for reason in blocking_reasons), \
-                    f"Blocking reason should mention permits. Got: {blocking_reasons}"
-    
-    # Property 2: Breakdown orders bypass permit validation
-    if is_breakdown:
-        # Breakdown orders should not be blocked by permits alone
-        # (they may be blocked by other prerequisites like technician assignment)
-        if not can_transition:
-            # If blocked, it should NOT be due to permits
-            permit_blocks = [r for r in blocking_reasons if "permit" in r.lower()]
-            assert len(permit_blocks) == 0, \
-                f"Breakdown orders should not be blocked by permits. Got: {permit_blocks}"
-    
-    # Property 3: Optional permits don't block release
-    optional_permits = [p for p in permits if not p.get("required", False)]
-    if optional_permits and not required_permits:
-        # With only optional permits, order should not be blocked by permits
-        if not can_transition:
-            permit_blocks = [r for r in blocking_reasons if "permit" in r.lower()]
-            assert len(permit_blocks) == 0, \
-                "Optional permits should not block release"
-    
-    # Property 4: Orders without permits should not be blocked by permit checks
-    if not permits:
-        if not can_transition:
-            permit_blocks = [r for r in blocking_reasons if "permit" in r.lower()]
-            assert len(permit_blocks) == 0, \
-                "Orders without permits should not be blocked by permit checks"
+def _permits_unapproved(order):
+    """General orders are blocked by any required permit that is not approved"""
+    return not order.is_breakdown and order.has_unapproved_permits
+
 
+def _materials_unavailable(order):
+    """General orders are blocked by critical materials neither available nor on order"""
+    return not order.is_breakdown and order.has_unavailable_critical
 
+
+def _no_technician(order):
+    """Every order is blocked until an operation has a technician"""
+    return not order.has_technician
+
+
+@pytest.mark.parametrize("keyword,predicate", [
+    ("permit", _permits_unapproved),
+    ("material", _materials_unavailable),
+    ("technician", _no_technician),
+])
 @given(order_data=screen3_order_strategy())
-@settings(max_examples=100)
-def test_property_material_availability_validation(order_data):
+@FAST
+def test_property_release_prerequisite_enforcement(keyword, predicate, order_data):
     """
+    **Feature: pm-6-screen-workflow, Property 7: Permit Enforcement**
     **Feature: pm-6-screen-workflow, Property 9: Material Availability Validation**
-    **Validates: Requirements 3.2, 3.6**
+    **Validates: Requirements 1.6, 3.1, 3.2, 3.6**
     
-    Property: For any maintenance order at release, if critical materials
-    are not available and not on confirmed delivery, the system should
-    prevent release or require override authorization.
+    Property: For any maintenance order, the transition to "Released" is
+    blocked for a permit, material or technician reason exactly when that
+    prerequisite is unmet.
     
     This test verifies that:
-    1. Orders with unavailable critical materials are blocked
-    2. Orders with critical materials on order can be released
-    3. Orders with available critical materials can be released
-    4. Breakdown orders have reduced material validation
-    5. Non-critical materials don't block release
+    1. Orders with unapproved required permits cannot be released
+    2. Orders with unavailable critical materials (not on order) cannot be released
+    3. Orders without technician assignment cannot be released
+    4. Breakdown orders bypass permit and material validation
+    5. Optional permits, non-critical materials and satisfied prerequisites never block
     """
-    state_machine = get_state_machine()
-    
-    # Check if order can transition from Planned to Released
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        order_data
-    )
-    
-    is_breakdown = order_data.get("order_type") == "breakdown"
-    components = order_data.get("components", [])
-    critical_components = [c for c in components if c.get("critical", False)]
-    
-    # Property 1: For general maintenance, critical materials must be available or on order
-    if not is_breakdown and critical_components:
-        unavailable_critical = [
-            c for c in critical_components
-            if not c.get("available", False) and not c.get("on_order", False)
-        ]
-        
-        if unavailable_critical:
-            # Order should be blocked
-            assert not can_transition or len(blocking_reasons) > 0, \
-                "Order with unavailable critical materials should be blocked or have warnings"
-            
-            # If blocked, reason should mention materials
-            if not can_transition:
-                assert any("material" in reason.lower() for reason in blocking_reasons), \
-                    f"Blocking reason should mention materials. Got: {blocking_reasons}"
-    
-    # Property 2: Critical materials on order should allow release
-    if not is_breakdown and critical_components:
-        all_on_order_or_available = all(
-            c.get("available", False) or c.get("on_order", False)
-            for c in critical_components
-        )
-        
-        if all_on_order_or_available:
-            # Materials should not block release
-            if not can_transition:
-                material_blocks = [r for r in blocking_reasons if "material" in r.lower()]
-                # If there are material blocks, they should not be about critical materials
-                # (could be about other validation)
-                pass  # This is acceptable - other prerequisites may block
+    frozen = _freeze(order_data)
+    can_transition, blocking_reasons = _cached_can_transition(frozen)
+    kinds = _classify(blocking_reasons)
+    unmet = predicate(_derive(frozen))
     
-    # Property 3: Breakdown orders bypass material validation
-    if is_breakdown:
-        # Breakdown orders should not be blocked by materials alone
-        if not can_transition:
-            material_blocks = [r for r in blocking_reasons if "material" in r.lower()]
-            assert len(material_blocks) == 0, \
-                f"Breakdown orders should not be blocked by materials. Got: {material_blocks}"
+    assert kinds[keyword] == unmet, \
+        f"{keyword.capitalize()} block should be present iff the prerequisite is unmet. Got: {blocking_reasons}"
     
-    # Property 4: Non-critical materials don't block release
-    non_critical_components = [c for c in components if not c.get("critical", False)]
-    if non_critical_components and not critical_components:
-        # With only non-critical materials, order should not be blocked by materials
-        if not can_transition:
-            material_blocks = [r for r in blocking_reasons if "material" in r.lower()]
-            assert len(material_blocks) == 0, \
-                "Non-critical materials should not block release"
-    
-    # Property 5: Orders without components should not be blocked by material checks
-    if not components:
-        if not can_transition:
-            material_blocks = [r for r in blocking_reasons if "material" in r.lower()]
-            assert len(material_blocks) == 0, \
-                "Orders without components should not be blocked by material checks"
+    if unmet:
+        assert not can_transition, \
+            f"Order with unmet {keyword} prerequisite should be blocked"
 
 
-@given(
-    general_order=screen3_order_strategy(order_type="general"),
-    breakdown_order=screen3_order_strategy(order_type="breakdown")
-)
-@settings(max_examples=100)
-def test_property_breakdown_order_acceleration(general_order, breakdown_order):
+@given(general_order=screen3_order_strategy(order_type="general"))
+@FAST
+def test_property_breakdown_order_acceleration(general_order):
     """
     **Feature: pm-6-screen-workflow, Property 5: Breakdown Order Acceleration**
     **Validates: Requirements 7.3, 7.4**
@@ -256,27 +251,16 @@ def test_property_breakdown_order_acceleration(general_order, breakdown_order):
     3. Breakdown orders bypass material availability validation
     4. Breakdown orders still require technician assignment
     """
-    state_machine = get_state_machine()
-    
-    # Ensure both orders have the same structure (except order_type)
-    # Copy permits and components from general to breakdown for fair comparison
-    breakdown_order["permits"] = general_order["permits"]
-    breakdown_order["components"] = general_order["components"]
-    breakdown_order["operations"] = general_order["operations"]
-    breakdown_order["cost_summary"] = general_order["cost_summary"]
+    # Check transitions for both orders; the breakdown variant has the same
+    # scope and differs only in order_type, so it is derived from the general one
+    frozen_general = _freeze(general_order)
+    can_transition_general, reasons_general = _cached_can_transition(frozen_general)
     
-    # Check transitions for both orders
-    can_transition_general, reasons_general = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        general_order
-    )
-    
-    can_transition_breakdown, reasons_breakdown = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        breakdown_order
+    can_transition_breakdown, reasons_breakdown = _cached_can_transition(
+        ("breakdown",) + frozen_general[1:]
     )
+    kinds_general = _classify(reasons_general)
+    kinds_breakdown = _classify(reasons_breakdown)
     
     # Property 1: Breakdown orders should have fewer or equal blocking reasons
     assert len(reasons_breakdown) <= len(reasons_general), \
@@ -284,27 +268,19 @@ def test_property_breakdown_order_acceleration(general_order, breakdown_order):
         f"General: {len(reasons_general)} blocks, Breakdown: {len(reasons_breakdown)} blocks"
     
     # Property 2: Breakdown orders should not be blocked by permits
-    permit_blocks_breakdown = [r for r in reasons_breakdown if "permit" in r.lower()]
-    assert len(permit_blocks_breakdown) == 0, \
-        f"Breakdown orders should bypass permit validation. Got: {permit_blocks_breakdown}"
+    assert not kinds_breakdown["permit"], \
+        f"Breakdown orders should bypass permit validation. Got: {reasons_breakdown}"
     
     # Property 3: Breakdown orders should not be blocked by materials
-    material_blocks_breakdown = [r for r in reasons_breakdown if "material" in r.lower()]
-    assert len(material_blocks_breakdown) == 0, \
-        f"Breakdown orders should bypass material validation. Got: {material_blocks_breakdown}"
+    assert not kinds_breakdown["material"], \
+        f"Breakdown orders should bypass material validation. Got: {reasons_breakdown}"
     
     # Property 4: If general order is blocked by permits or materials only,
     # breakdown order should be allowed (assuming technician assigned)
-    permit_blocks_general = [r for r in reasons_general if "permit" in r.lower()]
-    material_blocks_general = [r for r in reasons_general if "material" in r.lower()]
+    blocked_by_scope = kinds_general["permit"] or kinds_general["material"]
+    blocked_otherwise = kinds_general["technician"] or kinds_general["other"]
     
-    # Check if general order is blocked only by permits/materials
-    other_blocks_general = [
-        r for r in reasons_general
-        if "permit" not in r.lower() and "material" not in r.lower()
-    ]
-    
-    if (permit_blocks_general or material_blocks_general) and not other_blocks_general:
+    if blocked_by_scope and not blocked_otherwise:
         # General order blocked only by permits/materials
         # Breakdown order should be allowed
         assert can_transition_breakdown, \
@@ -312,57 +288,16 @@ def test_property_breakdown_order_acceleration(general_order, breakdown_order):
             f"General blocks: {reasons_general}, Breakdown blocks: {reasons_breakdown}"
     
     # Property 5: Both orders still require technician assignment
-    has_technician = any(op.get("technician_id") for op in breakdown_order.get("operations", []))
-    if not has_technician:
+    if not _derive(frozen_general).has_technician:
         # Both should be blocked by technician requirement
         if not can_transition_breakdown:
-            technician_blocks = [r for r in reasons_breakdown if "technician" in r.lower()]
-            assert len(technician_blocks) > 0, \
+            assert kinds_breakdown["technician"], \
                 "Breakdown orders should still require technician assignment"
 
 
 @given(order_data=screen3_order_strategy())
-@settings(max_examples=100)
-def test_property_release_requires_technician(order_data):
-    """
-    Property: All orders (general and breakdown) require technician assignment
-    
-    This test verifies that:
-    1. Orders without technician assignment cannot be released
-    2. Orders with at least one technician assigned can proceed to release validation
-    """
-    state_machine = get_state_machine()
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        order_data
-    )
-    
-    operations = order_data.get("operations", [])
-    has_technician = any(op.get("technician_id") for op in operations)
-    
-    # Property: Without technician, order must be blocked
-    if not has_technician:
-        assert not can_transition, \
-            "Order without technician assignment should be blocked"
-        assert any("technician" in reason.lower() for reason in blocking_reasons), \
-            f"Blocking reason should mention technician. Got: {blocking_reasons}"
-    
-    # Property: With technician, technician should not be a blocking reason
-    if has_technician:
-        if not can_transition:
-            technician_blocks = [r for r in blocking_reasons if "technician" in r.lower()]
-            assert len(technician_blocks) == 0, \
-                f"Order with technician should not be blocked by technician requirement. Got: {technician_blocks}"
-
-
-@given(
-    order_data=screen3_order_strategy(),
-    override_authorized=st.booleans()
-)
-@settings(max_examples=100)
-def test_property_block_override_authorization(order_data, override_authorized):
+@FAST
+def test_property_block_override_authorization(order_data):
     """
     Property: Block overrides require authorization
     
@@ -371,38 +306,37 @@ def test_property_block_override_authorization(order_data, override_authorized):
     2. Override authorization is tracked
     3. Override doesn't bypass all validations (e.g., still need technician)
     """
-    state_machine = get_state_machine()
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        order_data
-    )
-    
-    # If order is blocked
-    if not can_transition and len(blocking_reasons) > 0:
-        # Simulate override
-        if override_authorized:
-            # With override, certain blocks can be bypassed
-            # But critical blocks (like technician) should remain
-            has_technician = any(op.get("technician_id") for op in order_data.get("operations", []))
-            
-            # Property: Override can bypass permit and material blocks
-            permit_blocks = [r for r in blocking_reasons if "permit" in r.lower()]
-            material_blocks = [r for r in blocking_reasons if "material" in r.lower()]
-            
-            # These can be overridden
-            overridable_blocks = permit_blocks + material_blocks
-            
-            # Property: Technician requirement cannot be overridden
-            if not has_technician:
-                technician_blocks = [r for r in blocking_reasons if "technician" in r.lower()]
-                assert len(technician_blocks) > 0, \
-                    "Technician requirement should not be overridable"
+    frozen = _freeze(order_data)
+    can_transition, blocking_reasons = _cached_can_transition(frozen)
+    
+    # Only blocked orders exercise the override path; returning instead of
+    # assume() keeps unblocked draws from counting as invalid examples
+    if can_transition or not blocking_reasons:
+        return
+    kinds = _classify(blocking_reasons)
+    order = _derive(frozen)
+    
+    # Simulate an authorized override; without authorization the block simply
+    # stands, so there is nothing further to check for that case.
+    # With override, certain blocks can be bypassed
+    # But critical blocks (like technician) should remain
+    
+    # Property: Override can bypass permit and material blocks; with a
+    # technician assigned nothing non-overridable remains, so the release
+    # is permitted under override
+    overridable = kinds["permit"] or kinds["material"]
+    if overridable and order.has_technician:
+        assert not kinds["technician"], \
+            "Permit and material blocks should be permitted under override"
+    
+    # Property: Technician requirement cannot be overridden
+    if not order.has_technician:
+        assert kinds["technician"], \
+            "Technician requirement should not be overridable"
 
 
 @given(order_data=screen3_order_strategy())
-@settings(max_examples=100)
+@FAST
 def test_property_readiness_checklist_completeness(order_data):
     """
     Property: Readiness checklist covers all prerequisites
@@ -413,61 +347,16 @@ def test_property_readiness_checklist_completeness(order_data):
     3. Readiness checklist includes resource assignment
     4. Checklist items match blocking reasons
     """
-    state_machine = get_state_machine()
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.PLANNED,
-        WorkflowOrderStatus.RELEASED,
-        order_data
-    )
-    
-    # Build readiness checklist
-    checklist = {
-        "permits_approved": True,
-        "materials_available": True,
-        "technician_assigned": True,
-    }
-    
-    # Check permits
-    is_breakdown = order_data.get("order_type") == "breakdown"
-    if not is_breakdown:
-        permits = order_data.get("permits", [])
-        required_permits = [p for p in permits if p.get("required", False)]
-        if required_permits:
-            checklist["permits_approved"] = all(p.get("approved", False) for p in required_permits)
-    
-    # Check materials
-    if not is_breakdown:
-        components = order_data.get("components", [])
-        critical_components = [c for c in components if c.get("critical", False)]
-        if critical_components:
-            checklist["materials_available"] = all(
-                c.get("available", False) or c.get("on_order", False)
-                for c in critical_components
-            )
-    
-    # Check technician
-    operations = order_data.get("operations", [])
-    checklist["technician_assigned"] = any(op.get("technician_id") for op in operations)
-    
-    # Property: If checklist item is False, there should be a corresponding blocking reason
-    if not checklist["permits_approved"]:
-        if not can_transition:
-            assert any("permit" in reason.lower() for reason in blocking_reasons), \
-                "Permit checklist failure should have corresponding blocking reason"
-    
-    if not checklist["materials_available"]:
-        if not can_transition:
-            assert any("material" in reason.lower() for reason in blocking_reasons), \
-                "Material checklist failure should have corresponding blocking reason"
-    
-    if not checklist["technician_assigned"]:
-        assert not can_transition, \
-            "Technician checklist failure should block transition"
-        assert any("technician" in reason.lower() for reason in blocking_reasons), \
-            "Technician checklist failure should have corresponding blocking reason"
-    
-    # Property: If all checklist items are True, order should be releasable
-    if all(checklist.values()):
-        assert can_transition, \
-            f"Order with complete checklist should be releasable. Blocks: {blocking_reasons}"
+    frozen = _freeze(order_data)
+    can_transition, blocking_reasons = _cached_can_transition(frozen)
+    order = _derive(frozen)
+    
+    # Build readiness checklist; breakdown orders skip permit and material checks
+    permits_ok = order.is_breakdown or not order.has_unapproved_permits
+    materials_ok = order.is_breakdown or not order.has_unavailable_critical
+    technician_ok = order.has_technician
+    
+    # Property: The order is releasable exactly when every checklist item holds;
+    # the reason for each failed item is covered by the prerequisite test above
+    assert can_transition == (permits_ok and materials_ok and technician_ok), \
+        f"Order should be releasable iff its checklist is complete. Blocks: {blocking_reasons}"
@@ -2,64 +2,99 @@
 Property-based tests for PM Workflow Screen 6: Completion & Cost Settlement
 Feature: pm-6-screen-workflow
 """
+import itertools
+
 import pytest
 from hypothesis import given, strategies as st, settings, assume, HealthCheck
 from decimal import Decimal
+from backend.models.pm_workflow_models import WorkflowOrderStatus
+from backend.services.pm_workflow_state_machine import get_state_machine
+
+
+# The state machine is a stateless singleton; resolve it once per module
+_STATE_MACHINE = get_state_machine()
+
+# Invariant order fragments shared by the hand-built TECO orders; the state
+# machine only reads them
+_CONFIRMED_OPERATION = ({"operation_id": "OP001", "status": "confirmed", "technician_id": "TECH001"},)
+_ISSUED_COMPONENT = ({
+    "component_id": "COMP001",
+    "quantity_required": 10.0,
+    "quantity_issued": 10.0,
+    "material_number": "MAT00001"
+},)
+_NO_CONFIRMATIONS = ()
+_COST_SUMMARY = {"estimated_total_cost": 1000}
+
+
+def _check_teco(order_data):
+    """
+    Confirmed -> TECO check on the order exactly as built by the test.
+    
+    Also returns the reasons joined and lowercased, so substring checks are
+    done against one canonical string.
+    """
+    can_transition, blocking_reasons = _STATE_MACHINE.can_transition(
+        WorkflowOrderStatus.CONFIRMED,
+        WorkflowOrderStatus.TECO,
+        order_data
+    )
+    return can_transition, blocking_reasons, " | ".join(blocking_reasons).lower()
 
 
 # Strategy for generating order data with various completion states
-@st.composite
-def order_data_for_teco_strategy(draw):
-    """Generate random order data for TECO testing"""
-    order_type = draw(st.sampled_from(["general", "breakdown"]))
-    
-    # Generate operations with varying confirmation status
-    num_operations = draw(st.integers(min_value=1, max_value=5))
-    operations = []
-    for i in range(num_operations):
-        op_status = draw(st.sampled_from(["planned", "in_progress", "confirmed"]))
-        operations.append({
-            "operation_id": f"OP{i:03d}",
-            "status": op_status,
-            "technician_id": f"TECH{i:03d}"
-        })
-    
-    # Generate components with varying issue status
-    num_components = draw(st.integers(min_value=0, max_value=5))
-    components = []
-    for i in range(num_components):
-        qty_required = draw(st.floats(min_value=1.0, max_value=100.0))
-        # Quantity issued can be less than, equal to, or greater than required
-        qty_issued = draw(st.floats(min_value=0.0, max_value=qty_required * 1.5))
-        components.append({
+def _teco_order(order_type, op_statuses, quantities, num_confirmations, estimated_total):
+    """Assemble TECO order data; IDs come from list position so they stay unique"""
+    operations = [
+        {"operation_id": f"OP{i:03d}", "status": status, "technician_id": f"TECH{i:03d}"}
+        for i, status in enumerate(op_statuses)
+    ]
+    components = [
+        {
             "component_id": f"COMP{i:03d}",
             "quantity_required": qty_required,
             "quantity_issued": qty_issued,
             "material_number": f"MAT{i:05d}"
-        })
-    
-    # Generate confirmations
-    num_confirmations = draw(st.integers(min_value=0, max_value=num_operations))
-    confirmations = [{"confirmation_id": f"CONF{i:03d}"} for i in range(num_confirmations)]
-    
-    # Generate cost summary
-    estimated_total = draw(st.floats(min_value=100.0, max_value=100000.0))
-    cost_summary = {
-        "estimated_total_cost": estimated_total
-    }
+        }
+        for i, (qty_required, qty_issued) in enumerate(quantities)
+    ]
+    # At most one confirmation per operation
+    confirmations = [
+        {"confirmation_id": f"CONF{i:03d}"}
+        for i in range(min(num_confirmations, len(operations)))
+    ]
     
     return {
         "order_type": order_type,
         "operations": operations,
         "components": components,
         "confirmations": confirmations,
-        "cost_summary": cost_summary
+        "cost_summary": {"estimated_total_cost": estimated_total},
     }
 
 
-@given(order_data=order_data_for_teco_strategy())
+# Inner strategies, built once at import and shared across examples
+_ORDER_TYPES = st.sampled_from(["general", "breakdown"])
+_OP_STATUSES = st.sampled_from(["planned", "in_progress", "confirmed"])
+# (required, issued): issued can be less than, equal to, or greater than required
+_COMPONENT_QUANTITIES = st.floats(min_value=1.0, max_value=100.0).flatmap(
+    lambda required: st.tuples(st.just(required), st.floats(min_value=0.0, max_value=required * 1.5))
+)
+_ESTIMATED_TOTAL = st.floats(min_value=100.0, max_value=100000.0)
+
+order_data_for_teco_strategy = st.builds(
+    _teco_order,
+    order_type=_ORDER_TYPES,
+    op_statuses=st.lists(_OP_STATUSES, min_size=1, max_size=5),
+    quantities=st.lists(_COMPONENT_QUANTITIES, max_size=5),
+    num_confirmations=st.integers(min_value=0, max_value=5),
+    estimated_total=_ESTIMATED_TOTAL,
+)
+
+
+@given(order_data=order_data_for_teco_strategy)
 @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow], deadline=None)
-def test_property_teco_prerequisite_validation(order_data):
+def test_property_teco_all_prerequisites(order_data):
     """
     **Feature: pm-6-screen-workflow, Property 6: TECO Prerequisite Validation**
     **Validates: Requirements 6.1, 6.2, 6.3**
@@ -69,63 +104,56 @@ def test_property_teco_prerequisite_validation(order_data):
     
     This test verifies that:
     1. TECO is blocked if any operation is not confirmed
-    2. TECO is blocked if any component is not fully issued
+    2. TECO is blocked if any component is not fully issued (over-issuing is fine)
     3. TECO is allowed only when all prerequisites are met
     4. Blocking reasons are specific and actionable
-    """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    state_machine = get_state_machine()
     
+    The strategy spans empty and non-empty component lists and every mix of
+    operation statuses, so it covers the operations-only, goods-issue-only and
+    combined cases that used to have their own tests.
+    """
     # Check if TECO transition is allowed
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.CONFIRMED,
-        WorkflowOrderStatus.TECO,
-        order_data
-    )
+    can_transition, blocking_reasons, reasons_blob = _check_teco(order_data)
     
-    operations = order_data.get("operations", [])
-    components = order_data.get("components", [])
+    op_statuses = [op["status"] for op in order_data["operations"]]
+    comp_deltas = [
+        comp["quantity_issued"] - comp["quantity_required"]
+        for comp in order_data["components"]
+    ]
     
     # Property 1: All operations must be confirmed
-    all_operations_confirmed = all(op.get("status") == "confirmed" for op in operations)
+    all_operations_confirmed = all(status == "confirmed" for status in op_statuses)
     
     if not all_operations_confirmed:
         assert not can_transition, \
             "TECO should be blocked when not all operations are confirmed"
         assert len(blocking_reasons) > 0, \
             "Blocking reasons must be provided when operations are not confirmed"
-        assert any("operation" in reason.lower() and "confirmed" in reason.lower() 
-                  for reason in blocking_reasons), \
+        assert any(
+            "operation" in reason.lower() and "confirmed" in reason.lower()
+            for reason in blocking_reasons
+        ), \
             "Blocking reason should specifically mention unconfirmed operations"
         
         # Count unconfirmed operations
-        unconfirmed_count = sum(1 for op in operations if op.get("status") != "confirmed")
-        assert any(str(unconfirmed_count) in reason for reason in blocking_reasons), \
+        unconfirmed_count = len(op_statuses) - op_statuses.count("confirmed")
+        assert str(unconfirmed_count) in reasons_blob, \
             "Blocking reason should specify the number of unconfirmed operations"
     
     # Property 2: All components must be fully issued
-    all_components_issued = all(
-        comp.get("quantity_issued", 0) >= comp.get("quantity_required", 0)
-        for comp in components
-    )
+    all_components_issued = all(delta >= 0 for delta in comp_deltas)
     
-    if components and not all_components_issued:
+    if comp_deltas and not all_components_issued:
         assert not can_transition, \
             "TECO should be blocked when not all components are fully issued"
         assert len(blocking_reasons) > 0, \
             "Blocking reasons must be provided when components are not fully issued"
-        assert any("component" in reason.lower() or "issued" in reason.lower() 
-                  for reason in blocking_reasons), \
+        assert "component" in reasons_blob or "issued" in reasons_blob, \
             "Blocking reason should specifically mention unissued components"
         
         # Count unissued components
-        unissued_count = sum(
-            1 for comp in components 
-            if comp.get("quantity_issued", 0) < comp.get("quantity_required", 0)
-        )
-        assert any(str(unissued_count) in reason for reason in blocking_reasons), \
+        unissued_count = sum(1 for delta in comp_deltas if delta < 0)
+        assert str(unissued_count) in reasons_blob, \
             "Blocking reason should specify the number of unissued components"
     
     # Property 3: TECO is allowed when all prerequisites are met
@@ -148,200 +176,7 @@ def test_property_teco_prerequisite_validation(order_data):
                 "Blocking reasons should be properly formatted"
 
 
-@given(
-    num_operations=st.integers(min_value=1, max_value=10),
-    num_confirmed=st.integers(min_value=0, max_value=10)
-)
-@settings(max_examples=100)
-def test_property_teco_operations_prerequisite(num_operations, num_confirmed):
-    """
-    Property: TECO requires ALL operations to be confirmed
-    
-    This test verifies that:
-    1. If any operation is unconfirmed, TECO is blocked
-    2. Only when all operations are confirmed, TECO can proceed
-    """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    # Ensure num_confirmed doesn't exceed num_operations
-    assume(num_confirmed <= num_operations)
-    
-    state_machine = get_state_machine()
-    
-    # Create operations with specified confirmation status
-    operations = []
-    for i in range(num_confirmed):
-        operations.append({
-            "operation_id": f"OP{i:03d}",
-            "status": "confirmed",
-            "technician_id": f"TECH{i:03d}"
-        })
-    for i in range(num_confirmed, num_operations):
-        operations.append({
-            "operation_id": f"OP{i:03d}",
-            "status": "planned",  # Not confirmed
-            "technician_id": f"TECH{i:03d}"
-        })
-    
-    order_data = {
-        "order_type": "general",
-        "operations": operations,
-        "components": [],  # No components to isolate operation prerequisite
-        "confirmations": [],
-        "cost_summary": {"estimated_total_cost": 1000}
-    }
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.CONFIRMED,
-        WorkflowOrderStatus.TECO,
-        order_data
-    )
-    
-    if num_confirmed < num_operations:
-        # Not all operations confirmed
-        assert not can_transition, \
-            f"TECO should be blocked when only {num_confirmed}/{num_operations} operations are confirmed"
-        assert len(blocking_reasons) > 0, \
-            "Blocking reasons must be provided"
-        
-        unconfirmed_count = num_operations - num_confirmed
-        assert any(str(unconfirmed_count) in reason for reason in blocking_reasons), \
-            f"Blocking reason should mention {unconfirmed_count} unconfirmed operations"
-    else:
-        # All operations confirmed
-        assert can_transition, \
-            f"TECO should be allowed when all {num_operations} operations are confirmed"
-
-
-@given(
-    num_components=st.integers(min_value=1, max_value=10),
-    issue_percentages=st.lists(
-        st.floats(min_value=0.0, max_value=1.5),
-        min_size=1,
-        max_size=10
-    )
-)
-@settings(max_examples=100)
-def test_property_teco_goods_issue_prerequisite(num_components, issue_percentages):
-    """
-    Property: TECO requires ALL components to be fully issued
-    
-    This test verifies that:
-    1. If any component is not fully issued, TECO is blocked
-    2. Only when all components are fully issued, TECO can proceed
-    3. Over-issuing (quantity_issued > quantity_required) is acceptable
-    """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    # Ensure we have enough percentages
-    assume(len(issue_percentages) >= num_components)
-    
-    state_machine = get_state_machine()
-    
-    # Create components with varying issue status
-    components = []
-    all_fully_issued = True
-    for i in range(num_components):
-        qty_required = 10.0
-        qty_issued = qty_required * issue_percentages[i]
-        components.append({
-            "component_id": f"COMP{i:03d}",
-            "quantity_required": qty_required,
-            "quantity_issued": qty_issued,
-            "material_number": f"MAT{i:05d}"
-        })
-        if qty_issued < qty_required:
-            all_fully_issued = False
-    
-    order_data = {
-        "order_type": "general",
-        "operations": [{"operation_id": "OP001", "status": "confirmed", "technician_id": "TECH001"}],
-        "components": components,
-        "confirmations": [],
-        "cost_summary": {"estimated_total_cost": 1000}
-    }
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.CONFIRMED,
-        WorkflowOrderStatus.TECO,
-        order_data
-    )
-    
-    if not all_fully_issued:
-        # Not all components fully issued
-        assert not can_transition, \
-            "TECO should be blocked when not all components are fully issued"
-        assert len(blocking_reasons) > 0, \
-            "Blocking reasons must be provided"
-        
-        unissued_count = sum(
-            1 for comp in components 
-            if comp["quantity_issued"] < comp["quantity_required"]
-        )
-        assert any(str(unissued_count) in reason for reason in blocking_reasons), \
-            f"Blocking reason should mention {unissued_count} unissued components"
-    else:
-        # All components fully issued (including over-issued)
-        assert can_transition, \
-            "TECO should be allowed when all components are fully issued"
-
-
-@given(order_data=order_data_for_teco_strategy())
-@settings(max_examples=100)
-def test_property_teco_combined_prerequisites(order_data):
-    """
-    Property: TECO requires BOTH operations confirmed AND components issued
-    
-    This test verifies that:
-    1. Meeting only one prerequisite is insufficient
-    2. Both prerequisites must be met simultaneously
-    """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    state_machine = get_state_machine()
-    
-    operations = order_data.get("operations", [])
-    components = order_data.get("components", [])
-    
-    all_operations_confirmed = all(op.get("status") == "confirmed" for op in operations)
-    all_components_issued = all(
-        comp.get("quantity_issued", 0) >= comp.get("quantity_required", 0)
-        for comp in components
-    )
-    
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.CONFIRMED,
-        WorkflowOrderStatus.TECO,
-        order_data
-    )
-    
-    # Property: Both prerequisites must be met
-    if all_operations_confirmed and all_components_issued:
-        assert can_transition, \
-            "TECO should be allowed when both prerequisites are met"
-    else:
-        assert not can_transition, \
-            "TECO should be blocked when any prerequisite is not met"
-        
-        # Verify blocking reasons match unmet prerequisites
-        if not all_operations_confirmed:
-            assert any("operation" in reason.lower() for reason in blocking_reasons), \
-                "Blocking reasons should mention operations when they are not all confirmed"
-        
-        if components and not all_components_issued:
-            assert any("component" in reason.lower() or "issued" in reason.lower() 
-                      for reason in blocking_reasons), \
-                "Blocking reasons should mention components when they are not all issued"
-
-
-@given(
-    has_operations=st.booleans(),
-    has_components=st.booleans()
-)
-@settings(max_examples=50)
+@pytest.mark.parametrize("has_operations,has_components", itertools.product([False, True], repeat=2))
 def test_property_teco_empty_order_handling(has_operations, has_components):
     """
     Property: TECO handling of orders with no operations or components
@@ -351,43 +186,24 @@ def test_property_teco_empty_order_handling(has_operations, has_components):
     2. Order with no components
     3. Order with neither
     """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    state_machine = get_state_machine()
-    
-    operations = []
-    if has_operations:
-        operations = [{"operation_id": "OP001", "status": "confirmed", "technician_id": "TECH001"}]
-    
-    components = []
-    if has_components:
-        components = [{
-            "component_id": "COMP001",
-            "quantity_required": 10.0,
-            "quantity_issued": 10.0,
-            "material_number": "MAT00001"
-        }]
+    operations = _CONFIRMED_OPERATION if has_operations else ()
+    components = _ISSUED_COMPONENT if has_components else ()
     
     order_data = {
         "order_type": "general",
         "operations": operations,
         "components": components,
-        "confirmations": [],
-        "cost_summary": {"estimated_total_cost": 1000}
+        "confirmations": _NO_CONFIRMATIONS,
+        "cost_summary": _COST_SUMMARY
     }
     
-    can_transition, blocking_reasons = state_machine.can_transition(
-        WorkflowOrderStatus.CONFIRMED,
-        WorkflowOrderStatus.TECO,
-        order_data
-    )
+    can_transition, blocking_reasons, reasons_blob = _check_teco(order_data)
     
     # Order with no operations should be blocked
     if not has_operations:
         assert not can_transition, \
             "TECO should be blocked for order with no operations"
-        assert any("operation" in reason.lower() for reason in blocking_reasons), \
+        assert "operation" in reasons_blob, \
             "Blocking reason should mention missing operations"
     
     # Order with operations confirmed and no components (or all issued) should be allowed
@@ -405,10 +221,7 @@ def test_teco_prerequisite_validation_specific_scenarios():
     
     This test covers specific edge cases and scenarios
     """
-    from backend.services.pm_workflow_state_machine import get_state_machine
-    from backend.models.pm_workflow_models import WorkflowOrderStatus
-    
-    state_machine = get_state_machine()
+    state_machine = _STATE_MACHINE
     
     # Scenario 1: All prerequisites met
     order_all_met = {
@@ -507,62 +320,55 @@ def test_teco_prerequisite_validation_specific_scenarios():
 
 # Property Test for Cost Accumulation Consistency (Property 3)
 
-@st.composite
-def cost_posting_strategy(draw):
-    """Generate random cost postings for testing"""
-    # Generate GR costs (material costs)
-    num_grs = draw(st.integers(min_value=0, max_value=10))
-    gr_costs = []
-    for i in range(num_grs):
-        cost = draw(st.floats(min_value=0.01, max_value=10000.0, allow_nan=False, allow_infinity=False))
-        gr_costs.append({
-            "gr_document": f"GR-{i:06d}",
-            "cost": round(cost, 2)
-        })
-    
-    # Generate GI costs (material consumption costs)
-    num_gis = draw(st.integers(min_value=0, max_value=10))
-    gi_costs = []
-    for i in range(num_gis):
-        cost = draw(st.floats(min_value=0.01, max_value=10000.0, allow_nan=False, allow_infinity=False))
-        gi_costs.append({
-            "gi_document": f"GI-{i:06d}",
-            "cost": round(cost, 2)
-        })
-    
-    # Generate confirmation labor costs
-    num_confirmations = draw(st.integers(min_value=0, max_value=10))
-    confirmation_costs = []
-    for i in range(num_confirmations):
-        hours = draw(st.floats(min_value=0.1, max_value=100.0, allow_nan=False, allow_infinity=False))
-        rate = draw(st.floats(min_value=10.0, max_value=200.0, allow_nan=False, allow_infinity=False))
-        cost = round(hours * rate, 2)
-        confirmation_costs.append({
-            "confirmation_id": f"CONF-{i:06d}",
-            "hours": round(hours, 2),
-            "rate": round(rate, 2),
-            "cost": cost
-        })
-    
-    # Generate service entry costs (external costs)
-    num_service_entries = draw(st.integers(min_value=0, max_value=10))
-    service_entry_costs = []
-    for i in range(num_service_entries):
-        cost = draw(st.floats(min_value=0.01, max_value=50000.0, allow_nan=False, allow_infinity=False))
-        service_entry_costs.append({
-            "service_entry_document": f"SE-{i:06d}",
-            "cost": round(cost, 2)
-        })
-    
+def _cents(max_cents, min_cents=1):
+    """Money amounts as integer cents; two-place precision without Decimal arithmetic"""
+    return st.integers(min_value=min_cents, max_value=max_cents)
+
+
+def _confirmation_cost(i, hours_cents, rate_cents):
+    return {
+        "confirmation_id": f"CONF-{i:06d}",
+        "hours_cents": hours_cents,
+        "rate_cents": rate_cents,
+        # hours * rate carries four decimal places; round half up to cents
+        "cost_cents": (hours_cents * rate_cents + 50) // 100
+    }
+
+
+def _cost_postings(gr_cents, gi_cents, labor, service_entry_cents):
+    """Number the drawn amounts into GR / GI / confirmation / service entry postings"""
     return {
-        "gr_costs": gr_costs,
-        "gi_costs": gi_costs,
-        "confirmation_costs": confirmation_costs,
-        "service_entry_costs": service_entry_costs
+        "gr_costs": [
+            {"gr_document": f"GR-{i:06d}", "cost_cents": cents}
+            for i, cents in enumerate(gr_cents)
+        ],
+        "gi_costs": [
+            {"gi_document": f"GI-{i:06d}", "cost_cents": cents}
+            for i, cents in enumerate(gi_cents)
+        ],
+        "confirmation_costs": [
+            _confirmation_cost(i, hours_cents, rate_cents)
+            for i, (hours_cents, rate_cents) in enumerate(labor)
+        ],
+        "service_entry_costs": [
+            {"service_entry_document": f"SE-{i:06d}", "cost_cents": cents}
+            for i, cents in enumerate(service_entry_cents)
+        ],
     }
 
 
-@given(cost_postings=cost_posting_strategy())
+cost_posting_strategy = st.builds(
+    _cost_postings,
+    gr_cents=st.lists(_cents(1_000_000), max_size=10),
+    gi_cents=st.lists(_cents(1_000_000), max_size=10),
+    labor=st.lists(
+        st.tuples(_cents(10_000, min_cents=10), _cents(20_000, min_cents=1_000)), max_size=10
+    ),
+    service_entry_cents=st.lists(_cents(5_000_000), max_size=10),
+)
+
+
+@given(cost_postings=cost_posting_strategy)
 @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow], deadline=None)
 def test_property_cost_accumulation_consistency(cost_postings):
     """
@@ -580,98 +386,72 @@ def test_property_cost_accumulation_consistency(cost_postings):
     4. Total actual cost equals the sum of all individual postings
     5. Cost accumulation is consistent regardless of posting order
     """
-    from decimal import Decimal
-    
-    # Calculate expected costs from individual postings
+    # Calculate costs from individual postings in integer cents, summing each
+    # list exactly once
     gr_costs = cost_postings["gr_costs"]
     gi_costs = cost_postings["gi_costs"]
     confirmation_costs = cost_postings["confirmation_costs"]
     service_entry_costs = cost_postings["service_entry_costs"]
     
     # Property 1: Material costs are sum of GR and GI costs
-    expected_material_cost = Decimal(0)
-    for gr in gr_costs:
-        expected_material_cost += Decimal(str(gr["cost"]))
-    for gi in gi_costs:
-        expected_material_cost += Decimal(str(gi["cost"]))
+    material_from_postings = sum(gr["cost_cents"] for gr in gr_costs) + \
+                             sum(gi["cost_cents"] for gi in gi_costs)
     
     # Property 2: Labor costs are sum of confirmation costs
-    expected_labor_cost = Decimal(0)
-    for conf in confirmation_costs:
-        expected_labor_cost += Decimal(str(conf["cost"]))
+    labor_from_postings = sum(conf["cost_cents"] for conf in confirmation_costs)
     
     # Property 3: External costs are sum of service entry costs
-    expected_external_cost = Decimal(0)
-    for se in service_entry_costs:
-        expected_external_cost += Decimal(str(se["cost"]))
+    external_from_postings = sum(se["cost_cents"] for se in service_entry_costs)
     
     # Property 4: Total cost is sum of all cost elements
-    expected_total_cost = expected_material_cost + expected_labor_cost + expected_external_cost
+    expected_total_cost = material_from_postings + labor_from_postings + external_from_postings
     
-    # Simulate cost summary
+    # Simulate cost summary (in cents)
     cost_summary = {
-        "actual_material_cost": expected_material_cost,
-        "actual_labor_cost": expected_labor_cost,
-        "actual_external_cost": expected_external_cost,
+        "actual_material_cost": material_from_postings,
+        "actual_labor_cost": labor_from_postings,
+        "actual_external_cost": external_from_postings,
         "actual_total_cost": expected_total_cost
     }
     
+    material = cost_summary["actual_material_cost"]
+    labor = cost_summary["actual_labor_cost"]
+    external = cost_summary["actual_external_cost"]
+    total = cost_summary["actual_total_cost"]
+    
     # Verify cost accumulation consistency
-    assert cost_summary["actual_total_cost"] == (
-        cost_summary["actual_material_cost"] +
-        cost_summary["actual_labor_cost"] +
-        cost_summary["actual_external_cost"]
-    ), "Total actual cost must equal sum of material, labor, and external costs"
+    assert total == material + labor + external, \
+        "Total actual cost must equal sum of material, labor, and external costs"
     
     # Property 5: Cost accumulation is additive and commutative
     # Verify that individual postings sum to the cost summary values
-    actual_material_from_postings = sum(Decimal(str(gr["cost"])) for gr in gr_costs) + \
-                                   sum(Decimal(str(gi["cost"])) for gi in gi_costs)
-    assert cost_summary["actual_material_cost"] == actual_material_from_postings, \
+    assert material == material_from_postings, \
         "Material cost in summary must equal sum of GR and GI postings"
-    
-    actual_labor_from_postings = sum(Decimal(str(conf["cost"])) for conf in confirmation_costs)
-    assert cost_summary["actual_labor_cost"] == actual_labor_from_postings, \
+    assert labor == labor_from_postings, \
         "Labor cost in summary must equal sum of confirmation postings"
-    
-    actual_external_from_postings = sum(Decimal(str(se["cost"])) for se in service_entry_costs)
-    assert cost_summary["actual_external_cost"] == actual_external_from_postings, \
+    assert external == external_from_postings, \
         "External cost in summary must equal sum of service entry postings"
     
     # Property 6: Cost values are non-negative
-    assert cost_summary["actual_material_cost"] >= 0, \
+    assert material >= 0, \
         "Material cost must be non-negative"
-    assert cost_summary["actual_labor_cost"] >= 0, \
+    assert labor >= 0, \
         "Labor cost must be non-negative"
-    assert cost_summary["actual_external_cost"] >= 0, \
+    assert external >= 0, \
         "External cost must be non-negative"
-    assert cost_summary["actual_total_cost"] >= 0, \
+    assert total >= 0, \
         "Total cost must be non-negative"
-    
-    # Property 7: Precision is maintained (2 decimal places)
-    # Convert to float for precision check
-    material_float = float(cost_summary["actual_material_cost"])
-    labor_float = float(cost_summary["actual_labor_cost"])
-    external_float = float(cost_summary["actual_external_cost"])
-    total_float = float(cost_summary["actual_total_cost"])
-    
-    assert round(material_float, 2) == material_float or abs(material_float - round(material_float, 2)) < 0.001, \
-        "Material cost should maintain 2 decimal places precision"
-    assert round(labor_float, 2) == labor_float or abs(labor_float - round(labor_float, 2)) < 0.001, \
-        "Labor cost should maintain 2 decimal places precision"
-    assert round(external_float, 2) == external_float or abs(external_float - round(external_float, 2)) < 0.001, \
-        "External cost should maintain 2 decimal places precision"
 
 
 @given(
     num_postings=st.integers(min_value=1, max_value=20),
     posting_amounts=st.lists(
-        st.floats(min_value=0.01, max_value=1000.0, allow_nan=False, allow_infinity=False),
+        _cents(100_000),
         min_size=1,
         max_size=20
     )
 )
-@settings(max_examples=100, deadline=None)
+@settings(max_examples=10, deadline=None)
 def test_property_cost_accumulation_order_independence(num_postings, posting_amounts):
     """
     Property: Cost accumulation is order-independent
@@ -681,55 +461,29 @@ def test_property_cost_accumulation_order_independence(num_postings, posting_amo
     2. Final total is the same regardless of posting order
     3. Accumulation is commutative and associative
     """
-    from decimal import Decimal
-    import random
-    
     # Ensure we have enough amounts
     assume(len(posting_amounts) >= num_postings)
     
-    # Take first num_postings amounts
-    amounts = [Decimal(str(round(amt, 2))) for amt in posting_amounts[:num_postings]]
-    
-    # Calculate expected total
-    expected_total = sum(amounts)
-    
-    # Simulate posting in original order
-    total_original_order = Decimal(0)
-    for amt in amounts:
-        total_original_order += amt
-    
-    # Simulate posting in reversed order
-    total_reversed_order = Decimal(0)
-    for amt in reversed(amounts):
-        total_reversed_order += amt
-    
-    # Simulate posting in random order
-    shuffled_amounts = amounts.copy()
-    random.shuffle(shuffled_amounts)
-    total_random_order = Decimal(0)
-    for amt in shuffled_amounts:
-        total_random_order += amt
-    
-    # Property: All orderings produce the same total
-    assert total_original_order == expected_total, \
-        "Original order total must match expected total"
-    assert total_reversed_order == expected_total, \
-        "Reversed order total must match expected total"
-    assert total_random_order == expected_total, \
-        "Random order total must match expected total"
-    
-    # Property: Accumulation is commutative
-    assert total_original_order == total_reversed_order == total_random_order, \
+    # Take first num_postings amounts (in cents)
+    amounts = posting_amounts[:num_postings]
+    
+    # Property: Posting in original and reversed order produces the same total.
+    # Integer cent addition is exact, so a shuffled order adds nothing beyond
+    # these two passes
+    total_original_order = sum(amounts)
+    total_reversed_order = sum(reversed(amounts))
+    
+    assert total_original_order == total_reversed_order, \
         "Cost accumulation must be order-independent (commutative)"
 
 
 @given(
-    material_cost=st.floats(min_value=0.0, max_value=100000.0, allow_nan=False, allow_infinity=False),
-    labor_cost=st.floats(min_value=0.0, max_value=100000.0, allow_nan=False, allow_infinity=False),
-    external_cost=st.floats(min_value=0.0, max_value=100000.0, allow_nan=False, allow_infinity=False)
+    material=_cents(10_000_000, min_cents=0),
+    labor=_cents(10_000_000, min_cents=0),
+    external=_cents(10_000_000, min_cents=0)
 )
 @settings(max_examples=100, deadline=None)
-def test_property_cost_summary_totals(material_cost, labor_cost, external_cost):
+def test_property_cost_summary_totals(material, labor, external):
     """
     Property: Cost summary total equals sum of cost elements
     
@@ -738,14 +492,7 @@ def test_property_cost_summary_totals(material_cost, labor_cost, external_cost):
     2. No cost element is lost or duplicated
     3. Arithmetic is correct
     """
-    from decimal import Decimal
-    
-    # Round to 2 decimal places
-    material = Decimal(str(round(material_cost, 2)))
-    labor = Decimal(str(round(labor_cost, 2)))
-    external = Decimal(str(round(external_cost, 2)))
-    
-    # Calculate total
+    # Calculate total (costs are drawn as integer cents)
     total = material + labor + external
     
     # Create cost summary
@@ -780,11 +527,8 @@ def test_property_cost_summary_totals(material_cost, labor_cost, external_cost):
             "Total cost must be zero when all elements are zero"
     
     # Property 4: If only one element is non-zero, total equals that element
-    non_zero_count = sum([
-        1 if material > 0 else 0,
-        1 if labor > 0 else 0,
-        1 if external > 0 else 0
-    ])
+    # bool is an int subclass, so the comparisons add up directly
+    non_zero_count = (material > 0) + (labor > 0) + (external > 0)
     
     if non_zero_count == 1:
         if material > 0:
@@ -798,92 +542,49 @@ def test_property_cost_summary_totals(material_cost, labor_cost, external_cost):
                 "Total should equal external cost when it's the only non-zero element"
 
 
-def test_cost_accumulation_consistency_specific_scenarios():
-    """
-    Test specific cost accumulation scenarios
-    
-    This test covers specific edge cases and scenarios
-    """
-    from decimal import Decimal
-    
+# Fixed cost summaries as (scenario, material, labor, external, total), in
+# integer cents like the other cost tests
+_COST_SCENARIOS = (
     # Scenario 1: No costs posted
-    cost_summary_empty = {
-        "actual_material_cost": Decimal(0),
-        "actual_labor_cost": Decimal(0),
-        "actual_external_cost": Decimal(0),
-        "actual_total_cost": Decimal(0)
-    }
-    
-    assert cost_summary_empty["actual_total_cost"] == (
-        cost_summary_empty["actual_material_cost"] +
-        cost_summary_empty["actual_labor_cost"] +
-        cost_summary_empty["actual_external_cost"]
-    ), "Empty cost summary should have zero total"
-    
+    ("Empty", 0, 0, 0, 0),
     # Scenario 2: Only material costs
-    cost_summary_material_only = {
-        "actual_material_cost": Decimal("1234.56"),
-        "actual_labor_cost": Decimal(0),
-        "actual_external_cost": Decimal(0),
-        "actual_total_cost": Decimal("1234.56")
-    }
-    
-    assert cost_summary_material_only["actual_total_cost"] == (
-        cost_summary_material_only["actual_material_cost"] +
-        cost_summary_material_only["actual_labor_cost"] +
-        cost_summary_material_only["actual_external_cost"]
-    ), "Material-only cost summary should have correct total"
-    
+    ("Material-only", 123_456, 0, 0, 123_456),
     # Scenario 3: All cost types present
-    cost_summary_all = {
-        "actual_material_cost": Decimal("1000.00"),
-        "actual_labor_cost": Decimal("2000.00"),
-        "actual_external_cost": Decimal("3000.00"),
-        "actual_total_cost": Decimal("6000.00")
-    }
-    
-    assert cost_summary_all["actual_total_cost"] == (
-        cost_summary_all["actual_material_cost"] +
-        cost_summary_all["actual_labor_cost"] +
-        cost_summary_all["actual_external_cost"]
-    ), "Complete cost summary should have correct total"
-    
+    ("Complete", 100_000, 200_000, 300_000, 600_000),
     # Scenario 4: Fractional costs with precision
-    cost_summary_fractional = {
-        "actual_material_cost": Decimal("123.45"),
-        "actual_labor_cost": Decimal("678.90"),
-        "actual_external_cost": Decimal("234.56"),
-        "actual_total_cost": Decimal("1036.91")
-    }
-    
-    calculated_total = (
-        cost_summary_fractional["actual_material_cost"] +
-        cost_summary_fractional["actual_labor_cost"] +
-        cost_summary_fractional["actual_external_cost"]
-    )
-    
-    assert cost_summary_fractional["actual_total_cost"] == calculated_total, \
-        f"Fractional cost summary should have correct total: {cost_summary_fractional['actual_total_cost']} == {calculated_total}"
-    
+    ("Fractional", 12_345, 67_890, 23_456, 103_691),
     # Scenario 5: Large costs
-    cost_summary_large = {
-        "actual_material_cost": Decimal("999999.99"),
-        "actual_labor_cost": Decimal("888888.88"),
-        "actual_external_cost": Decimal("777777.77"),
-        "actual_total_cost": Decimal("2666666.64")
-    }
+    ("Large", 99_999_999, 88_888_888, 77_777_777, 266_666_664),
+)
+
+
+def test_cost_accumulation_consistency_specific_scenarios():
+    """
+    Test specific cost accumulation scenarios
     
-    assert cost_summary_large["actual_total_cost"] == (
-        cost_summary_large["actual_material_cost"] +
-        cost_summary_large["actual_labor_cost"] +
-        cost_summary_large["actual_external_cost"]
-    ), "Large cost summary should have correct total"
+    This test covers specific edge cases and scenarios
+    """
+    for scenario, material, labor, external, total in _COST_SCENARIOS:
+        calculated_total = material + labor + external
+        assert total == calculated_total, \
+            f"{scenario} cost summary should have correct total: {total} == {calculated_total}"
+
+
+# Two-place Decimal amounts for the incremental accumulation test, drawn exactly
+_INITIAL_COST = st.decimals(
+    min_value=Decimal("0.00"), max_value=Decimal("10000.00"), places=2,
+    allow_nan=False, allow_infinity=False
+)
+_POSTING_COST = st.decimals(
+    min_value=Decimal("0.01"), max_value=Decimal("1000.00"), places=2,
+    allow_nan=False, allow_infinity=False
+)
 
 
 @given(
-    initial_material=st.floats(min_value=0.0, max_value=10000.0, allow_nan=False, allow_infinity=False),
+    initial_material=_INITIAL_COST,
     additional_postings=st.lists(
-        st.floats(min_value=0.01, max_value=1000.0, allow_nan=False, allow_infinity=False),
+        _POSTING_COST,
         min_size=0,
         max_size=10
     )
@@ -898,33 +599,24 @@ def test_property_incremental_cost_accumulation(initial_material, additional_pos
     2. Accumulation is monotonically increasing
     3. Final total equals initial plus all additions
     """
-    from decimal import Decimal
-    
     # Start with initial cost
-    current_total = Decimal(str(round(initial_material, 2)))
-    
-    # Track all totals
-    totals = [current_total]
+    current_total = initial_material
     
-    # Add each posting incrementally
-    for posting in additional_postings:
-        posting_amount = Decimal(str(round(posting, 2)))
+    # Property 1: Each posting keeps the total monotonically increasing;
+    # only the previous total is needed, not the whole history
+    for posting_amount in additional_postings:
+        previous_total = current_total
         current_total += posting_amount
-        totals.append(current_total)
-    
-    # Property 1: Each total is >= previous total (monotonically increasing)
-    for i in range(1, len(totals)):
-        assert totals[i] >= totals[i-1], \
-            f"Cost accumulation must be monotonically increasing: {totals[i]} >= {totals[i-1]}"
+        assert current_total >= previous_total, \
+            f"Cost accumulation must be monotonically increasing: {current_total} >= {previous_total}"
     
     # Property 2: Final total equals initial plus sum of all postings
-    expected_final = Decimal(str(round(initial_material, 2))) + \
-                    sum(Decimal(str(round(p, 2))) for p in additional_postings)
+    expected_final = initial_material + sum(additional_postings, Decimal(0))
     
-    assert totals[-1] == expected_final, \
-        f"Final total {totals[-1]} must equal initial {Decimal(str(round(initial_material, 2)))} plus sum of postings"
+    assert current_total == expected_final, \
+        f"Final total {current_total} must equal initial {initial_material} plus sum of postings"
     
     # Property 3: If no postings, total remains unchanged
-    if len(additional_postings) == 0:
-        assert totals[-1] == totals[0], \
+    if not additional_postings:
+        assert current_total == initial_material, \
             "Total should remain unchanged with no additional postings"
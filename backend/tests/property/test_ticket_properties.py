@@ -4,8 +4,11 @@ Property-based tests for ticket creation validity and state machine.
 **Feature: sap-erp-demo, Property 2: Ticket State Machine Enforcement**
 **Validates: Requirements 1.1, 1.2, 1.3, 1.4, 1.5**
 """
+import operator
 import re
 from datetime import datetime, timedelta
+
+import pytest
 from hypothesis import given, strategies as st, settings
 
 from backend.models.ticket_models import Module, Priority, TicketType, TicketStatus
@@ -25,19 +28,26 @@ from backend.services.ticket_service import (
 
 
 # Strategies for generating test data
-module_strategy = st.sampled_from(list(Module))
-priority_strategy = st.sampled_from(list(Priority))
-ticket_type_strategy = st.sampled_from(list(TicketType))
+_MODULES = tuple(Module)
+_PRIORITIES = tuple(Priority)
+_TICKET_TYPES = tuple(TicketType)
+_STATUSES = tuple(TicketStatus)
+module_strategy = st.sampled_from(_MODULES)
+priority_strategy = st.sampled_from(_PRIORITIES)
+ticket_type_strategy = st.sampled_from(_TICKET_TYPES)
 sequence_strategy = st.integers(min_value=1, max_value=9999)
 date_strategy = st.datetimes(
     min_value=datetime(2020, 1, 1),
     max_value=datetime(2030, 12, 31)
 )
-title_strategy = st.text(min_size=1, max_size=255).filter(lambda x: x.strip())
-user_strategy = st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
+# A letter or digit followed by free text: never blank, so no draws are wasted
+# on a strip() filter, while spaces inside values ("Pump failure") still occur
+_NONBLANK_HEAD = st.characters(whitelist_categories=("L", "N"))
+title_strategy = st.builds(operator.add, _NONBLANK_HEAD, st.text(max_size=254))
+user_strategy = st.builds(operator.add, _NONBLANK_HEAD, st.text(max_size=99))
 
 
-@settings(max_examples=100)
+@settings(max_examples=25, deadline=None)
 @given(
     module=module_strategy,
     date=date_strategy,
@@ -65,28 +75,42 @@ def test_ticket_id_format_validity(module: Module, date: datetime, sequence: int
     assert parts[3] == f"{sequence:04d}", f"Expected sequence '{sequence:04d}', got '{parts[3]}'"
 
 
-@settings(max_examples=100)
-@given(
-    module=module_strategy,
-    date=date_strategy,
-    sequence=sequence_strategy
-)
-def test_ticket_id_validation_roundtrip(module: Module, date: datetime, sequence: int):
+# Bulk grid for the ID roundtrip: 100 dates spread over the strategy's range and
+# 100 sequences covering both ends of 1-9999, for every module
+_BULK_DATES = tuple(datetime(2020, 1, 1) + timedelta(days=40 * i) for i in range(100))
+_BULK_SEQUENCES = tuple(range(1, 10000, 101)) + (9999,)
+
+
+def test_ticket_id_bulk_roundtrip():
     """
     **Feature: sap-erp-demo, Property 1: Ticket Creation Validity**
     **Validates: Requirements 1.1**
     
     Property: For any generated ticket ID, validation SHALL return True
+    
+    The format is fixed, so a sampled grid of every module × 100 dates × 100
+    sequences is validated in one pass rather than example by example.
     """
-    ticket_id = generate_ticket_id(module, date, sequence)
-    is_valid, error = validate_ticket_id(ticket_id)
+    ids = [
+        generate_ticket_id(module, date, sequence)
+        for module in _MODULES
+        for date in _BULK_DATES
+        for sequence in _BULK_SEQUENCES
+    ]
+    # validate_ticket_id returns an (is_valid, error) tuple, which is always
+    # truthy, so unpack it rather than passing the results to all(); a valid
+    # ID must also come back with an empty error message
+    failures = [
+        (ticket_id, error)
+        for ticket_id, (is_valid, error) in zip(ids, map(validate_ticket_id, ids))
+        if not is_valid or error != ""
+    ]
     
-    assert is_valid, f"Generated ticket ID '{ticket_id}' failed validation: {error}"
-    assert error == "", f"Expected empty error message, got '{error}'"
+    assert not failures, \
+        f"Generated ticket IDs failed validation or returned an error message: {failures[:10]}"
 
 
-@settings(max_examples=100)
-@given(ticket_type=ticket_type_strategy)
+@pytest.mark.parametrize("ticket_type", list(TicketType))
 def test_ticket_type_validity(ticket_type: TicketType):
     """
     **Feature: sap-erp-demo, Property 1: Ticket Creation Validity**
@@ -102,7 +126,7 @@ def test_ticket_type_validity(ticket_type: TicketType):
     assert ticket_type.value in valid_types, f"Ticket type '{ticket_type.value}' not in expected set"
 
 
-@settings(max_examples=100)
+@settings(max_examples=100, deadline=None)
 @given(
     priority=priority_strategy,
     created_at=date_strategy
@@ -125,7 +149,7 @@ def test_sla_deadline_calculation(priority: Priority, created_at: datetime):
     )
 
 
-@settings(max_examples=100)
+@settings(max_examples=100, deadline=None)
 @given(
     module=module_strategy,
     ticket_type=ticket_type_strategy,
@@ -187,96 +211,35 @@ def test_complete_ticket_creation(
 
 
 
-# Strategies for state machine tests
-status_strategy = st.sampled_from(list(TicketStatus))
+# The only valid path, strictly forward: Open → Assigned → In_Progress → Closed
+_STATUS_PATH = (TicketStatus.OPEN, TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS, TicketStatus.CLOSED)
+_STATUS_INDEX = {status: i for i, status in enumerate(_STATUS_PATH)}
 
+# Every (current, target) pair with its expected validity. A transition is valid
+# only when it moves exactly one step forward along the path, which also rules
+# out backward moves, skipped states and leaving Closed
+_TRANSITION_TABLE = [
+    (current, target, _STATUS_INDEX[target] == _STATUS_INDEX[current] + 1)
+    for current in _STATUSES
+    for target in _STATUSES
+]
 
-@settings(max_examples=100)
-@given(
-    current_status=status_strategy,
-    target_status=status_strategy
-)
-def test_state_machine_valid_transitions(current_status: TicketStatus, target_status: TicketStatus):
+
+@pytest.mark.parametrize("current_status,target_status,expected", _TRANSITION_TABLE)
+def test_state_machine_transitions(current_status: TicketStatus, target_status: TicketStatus, expected: bool):
     """
     **Feature: sap-erp-demo, Property 2: Ticket State Machine Enforcement**
     **Validates: Requirements 1.4, 1.5**
     
     Property: For any ticket and any attempted status transition, the system SHALL:
     - Accept transitions following the valid path: Open → Assigned → In_Progress → Closed
-    - Reject any transition that violates this sequence
+    - Reject backward transitions, skipped states, and any transition out of Closed
+    
+    The status space is small enough to check every pair exhaustively.
     """
     is_valid = is_valid_transition(current_status, target_status)
     
-    # Define the expected valid transitions
-    expected_valid = {
-        (TicketStatus.OPEN, TicketStatus.ASSIGNED): True,
-        (TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS): True,
-        (TicketStatus.IN_PROGRESS, TicketStatus.CLOSED): True,
-    }
-    
-    expected = expected_valid.get((current_status, target_status), False)
-    
     assert is_valid == expected, (
         f"Transition from {current_status.value} to {target_status.value}: "
         f"expected {expected}, got {is_valid}"
     )
-
-
-@settings(max_examples=100)
-@given(current_status=status_strategy)
-def test_state_machine_no_backward_transitions(current_status: TicketStatus):
-    """
-    **Feature: sap-erp-demo, Property 2: Ticket State Machine Enforcement**
-    **Validates: Requirements 1.5**
-    
-    Property: For any ticket status, backward transitions SHALL be rejected.
-    The valid path is strictly forward: Open → Assigned → In_Progress → Closed
-    """
-    status_order = [TicketStatus.OPEN, TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS, TicketStatus.CLOSED]
-    current_index = status_order.index(current_status)
-    
-    # Check that all backward transitions are invalid
-    for i in range(current_index):
-        backward_status = status_order[i]
-        assert not is_valid_transition(current_status, backward_status), (
-            f"Backward transition from {current_status.value} to {backward_status.value} "
-            f"should be invalid"
-        )
-
-
-@settings(max_examples=100)
-@given(current_status=status_strategy)
-def test_state_machine_no_skip_transitions(current_status: TicketStatus):
-    """
-    **Feature: sap-erp-demo, Property 2: Ticket State Machine Enforcement**
-    **Validates: Requirements 1.5**
-    
-    Property: For any ticket status, skipping states SHALL be rejected.
-    E.g., Open → In_Progress is invalid (must go through Assigned)
-    """
-    status_order = [TicketStatus.OPEN, TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS, TicketStatus.CLOSED]
-    current_index = status_order.index(current_status)
-    
-    # Check that skipping states is invalid (jumping more than 1 step)
-    for i in range(current_index + 2, len(status_order)):
-        skip_status = status_order[i]
-        assert not is_valid_transition(current_status, skip_status), (
-            f"Skip transition from {current_status.value} to {skip_status.value} "
-            f"should be invalid"
-        )
-
-
-@settings(max_examples=100)
-@given(current_status=status_strategy)
-def test_closed_status_is_terminal(current_status: TicketStatus):
-    """
-    **Feature: sap-erp-demo, Property 2: Ticket State Machine Enforcement**
-    **Validates: Requirements 1.5**
-    
-    Property: Once a ticket is Closed, no further transitions SHALL be allowed.
-    """
-    if current_status == TicketStatus.CLOSED:
-        for target_status in TicketStatus:
-            assert not is_valid_transition(TicketStatus.CLOSED, target_status), (
-                f"Transition from Closed to {target_status.value} should be invalid"
-            )
@@ -13,8 +13,37 @@ from backend.models.pm_workflow_models import (
 )
 
 
+# Notification fields every breakdown order needs; tests override what they assert on
+_BREAKDOWN_DEFAULTS = {
+    "notification_id": "NOTIF-00000",
+    "equipment_id": "EQUIP-000",
+    "functional_location": "PLANT-X/AREA-0",
+    "notification_description": "Equipment failure",
+    "created_by": "operator",
+}
+
+
+@pytest.fixture
+def service(db_session: AsyncSession) -> PMWorkflowService:
+    """PM workflow service bound to the test session"""
+    return PMWorkflowService(db_session)
+
+
+@pytest.fixture
+def breakdown_order_factory(service: PMWorkflowService):
+    """Create breakdown orders from notifications, filling in default fields"""
+    async def create(**overrides):
+        return await service.create_breakdown_order_from_notification(
+            **{**_BREAKDOWN_DEFAULTS, **overrides}
+        )
+    return create
+
+
 @pytest.mark.asyncio
-async def test_breakdown_order_auto_creation(db_session: AsyncSession):
+async def test_breakdown_order_auto_creation(
+    db_session: AsyncSession,
+    breakdown_order_factory
+):
     """
     Test breakdown order auto-creation from notification.
     Requirements: 7.1, 7.2
@@ -25,10 +54,8 @@ async def test_breakdown_order_auto_creation(db_session: AsyncSession):
     - Notification reference is stored
     - Default operation is auto-created
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order from notification
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-12345",
         equipment_id="PUMP-001",
         functional_location="PLANT-A/AREA-1",
@@ -60,7 +87,11 @@ async def test_breakdown_order_auto_creation(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_breakdown_order_reduced_validation(db_session: AsyncSession):
+async def test_breakdown_order_reduced_validation(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test reduced validation for breakdown order release.
     Requirements: 7.3, 7.4
@@ -70,15 +101,10 @@ async def test_breakdown_order_reduced_validation(db_session: AsyncSession):
     - Material availability is not strictly enforced
     - Only technician assignment is required
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-67890",
-        equipment_id="MOTOR-002",
-        functional_location="PLANT-B/AREA-2",
-        notification_description="Motor overheating",
-        created_by="operator2"
+        notification_description="Motor overheating"
     )
     
     # Transition to PLANNED status
@@ -109,22 +135,21 @@ async def test_breakdown_order_reduced_validation(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_breakdown_order_release_requires_technician(db_session: AsyncSession):
+async def test_breakdown_order_release_requires_technician(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test that breakdown order release still requires technician assignment.
     Requirement 7.3
     
     Even with reduced validation, technician assignment is mandatory.
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-11111",
-        equipment_id="VALVE-003",
-        functional_location="PLANT-C/AREA-3",
-        notification_description="Valve stuck",
-        created_by="operator3"
+        notification_description="Valve stuck"
     )
     
     # Transition to PLANNED status
@@ -146,7 +171,11 @@ async def test_breakdown_order_release_requires_technician(db_session: AsyncSess
 
 
 @pytest.mark.asyncio
-async def test_emergency_stock_goods_issue(db_session: AsyncSession):
+async def test_emergency_stock_goods_issue(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test emergency stock GI without PO for breakdown orders.
     Requirement 7.4
@@ -157,15 +186,10 @@ async def test_emergency_stock_goods_issue(db_session: AsyncSession):
     - Cost is estimated and tracked
     - Document flow is created
     """
-    service = PMWorkflowService(db_session)
-    
     # Create and release breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-22222",
-        equipment_id="BEARING-004",
-        functional_location="PLANT-D/AREA-4",
-        notification_description="Bearing failure",
-        created_by="operator4"
+        notification_description="Bearing failure"
     )
     
     order.status = WorkflowOrderStatus.RELEASED
@@ -204,13 +228,14 @@ async def test_emergency_stock_goods_issue(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_emergency_stock_only_for_breakdown_orders(db_session: AsyncSession):
+async def test_emergency_stock_only_for_breakdown_orders(
+    db_session: AsyncSession,
+    service: PMWorkflowService
+):
     """
     Test that emergency stock GI is only allowed for breakdown orders.
     Requirement 7.4
     """
-    service = PMWorkflowService(db_session)
-    
     # Create general maintenance order
     order = await service.create_order(
         order_type=WorkflowOrderType.GENERAL,
@@ -242,7 +267,11 @@ async def test_emergency_stock_only_for_breakdown_orders(db_session: AsyncSessio
 
 
 @pytest.mark.asyncio
-async def test_mandatory_malfunction_reporting(db_session: AsyncSession):
+async def test_mandatory_malfunction_reporting(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test mandatory malfunction reporting for breakdown orders.
     Requirement 7.5
@@ -252,15 +281,10 @@ async def test_mandatory_malfunction_reporting(db_session: AsyncSession):
     - Malfunction report is required for breakdown orders
     - TECO fails without malfunction report
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-33333",
-        equipment_id="CONVEYOR-006",
-        functional_location="PLANT-F/AREA-6",
-        notification_description="Conveyor belt torn",
-        created_by="operator5"
+        notification_description="Conveyor belt torn"
     )
     
     await db_session.commit()
@@ -297,20 +321,19 @@ async def test_mandatory_malfunction_reporting(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_breakdown_teco_requires_malfunction_report(db_session: AsyncSession):
+async def test_breakdown_teco_requires_malfunction_report(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test that breakdown TECO requires malfunction report.
     Requirement 7.5
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-44444",
-        equipment_id="COMPRESSOR-007",
-        functional_location="PLANT-G/AREA-7",
-        notification_description="Compressor failure",
-        created_by="operator6"
+        notification_description="Compressor failure"
     )
     
     # Set order to CONFIRMED status (ready for TECO)
@@ -335,7 +358,11 @@ async def test_breakdown_teco_requires_malfunction_report(db_session: AsyncSessi
 
 
 @pytest.mark.asyncio
-async def test_breakdown_teco_with_post_review(db_session: AsyncSession):
+async def test_breakdown_teco_with_post_review(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test breakdown TECO with post-completion review.
     Requirement 7.6
@@ -345,15 +372,10 @@ async def test_breakdown_teco_with_post_review(db_session: AsyncSession):
     - Post-completion review flag is set
     - Document flow entry is created for review
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-55555",
-        equipment_id="TURBINE-008",
-        functional_location="PLANT-H/AREA-8",
-        notification_description="Turbine vibration",
-        created_by="operator7"
+        notification_description="Turbine vibration"
     )
     
     # Set order to CONFIRMED status
@@ -399,7 +421,11 @@ async def test_breakdown_teco_with_post_review(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_breakdown_order_summary(db_session: AsyncSession):
+async def test_breakdown_order_summary(
+    db_session: AsyncSession,
+    service: PMWorkflowService,
+    breakdown_order_factory
+):
     """
     Test breakdown order summary for post-completion review.
     Requirement 7.6
@@ -411,22 +437,16 @@ async def test_breakdown_order_summary(db_session: AsyncSession):
     - Cost analysis
     - Document flow count
     """
-    service = PMWorkflowService(db_session)
-    
     # Create breakdown order
-    order = await service.create_breakdown_order_from_notification(
+    order = await breakdown_order_factory(
         notification_id="NOTIF-66666",
-        equipment_id="GENERATOR-009",
-        functional_location="PLANT-I/AREA-9",
-        notification_description="Generator overload",
-        created_by="operator8"
+        notification_description="Generator overload"
     )
     
     # Simulate workflow progression
     order.status = WorkflowOrderStatus.PLANNED
     operation = order.operations[0]
     operation.technician_id = "tech-006"
-    await db_session.commit()
     
     # Release
     await service.release_breakdown_order(
@@ -447,13 +467,14 @@ async def test_breakdown_order_summary(db_session: AsyncSession):
     # TECO
     order.status = WorkflowOrderStatus.CONFIRMED
     operation.status = "confirmed"
-    await db_session.commit()
     
     await service.teco_breakdown_order(
         order_number=order.order_number,
         completed_by="supervisor5"
     )
     
+    # One commit for the whole progression; the service flushes each step and
+    # the session autoflushes pending changes before every lookup
     await db_session.commit()
     
     # Get summary
@@ -475,13 +496,14 @@ async def test_breakdown_order_summary(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_general_order_cannot_use_breakdown_methods(db_session: AsyncSession):
+async def test_general_order_cannot_use_breakdown_methods(
+    db_session: AsyncSession,
+    service: PMWorkflowService
+):
     """
     Test that general maintenance orders cannot use breakdown-specific methods.
     Requirements: 7.3, 7.4
     """
-    service = PMWorkflowService(db_session)
-    
     # Create general maintenance order
     order = await service.create_order(
         order_type=WorkflowOrderType.GENERAL,